@@ -1,5 +1,8 @@
+import math
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from random import Random
+from typing import Optional, Dict, Type
 
 import pygame
 import pymunk
@@ -46,6 +49,7 @@ class StoreMixin(ABC):
         if hasattr(self, "_obj_id"):
             del self.store[self._obj_id]
         self.store[val] = self
+        self.store.reserve(val)
         self._obj_id = val
 
 
@@ -123,6 +127,20 @@ class Entity(
     def take_damage(self, damage: float, sender: "Entity") -> None:
         self.on_damage.emit(damage, sender)
 
+    @abstractmethod
+    def drift(self, dt: float) -> None:
+        pass
+
+    # Dependent entities can be loaded only after entities they depend on
+    @classmethod
+    def is_loadable(cls, data: Dict) -> bool:
+        return True
+
+    # Entity draws nothing farther than this from its position
+    @property
+    def render_radius(self) -> float:
+        return math.inf
+
     def __repr__(self):
         return f"{self.__class__.__name__}(obj_id={self.obj_id})"
 
@@ -131,8 +149,32 @@ class Entity(
         pass
 
 
+@dataclass
+class EntityDescription:
+    # Plain data which is enough for the factory to create an entity
+    factory: Type["EntityFactory"]
+    pos: Vec2d
+    params: Dict
+
+    def create(self) -> Entity:
+        return self.factory.create_from_description(self)
+
+
 class EntityFactory(ABC):
+    @classmethod
+    def create_entity(cls, pos: Vec2d, rng: Optional[Random] = None) -> Entity:
+        return cls.create_from_description(cls.describe_entity(pos, rng))
+
+    # Describing may be done in other threads, so it must not create entities.
+    # All randomness must come from rng, so descriptions are reproducible
+    @classmethod
+    @abstractmethod
+    def describe_entity(
+        cls, pos: Vec2d, rng: Optional[Random] = None
+    ) -> EntityDescription:
+        pass
+
     @classmethod
     @abstractmethod
-    def create_entity(cls, pos: Vec2d) -> Entity:
+    def create_from_description(cls, description: EntityDescription) -> Entity:
         pass
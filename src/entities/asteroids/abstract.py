@@ -18,12 +18,15 @@ from src.entities.modifiers_and_characteristics import (
 from src.entities.pickupable.resource import PickupableResource
 from src.environment.abstract import get_environment
 from src.resources import Resource
-from src.settings import get_asteroid_config, DUST_PARTICLE_IMAGE, load_image
+from src.settings import get_asteroid_config, DUST_PARTICLE_IMAGE
+from src.utils.image_manager import ImageManager
 from src.utils.serializable_dataclass import SerializableDataclass
 from src.utils.sound_manager import SoundManager
 
 
-@dataclass
+# Asteroids are rendered once, and view data is the key of rendered surfaces,
+# so it is compared and hashed by identity
+@dataclass(eq=False)
 class AsteroidViewData(SerializableDataclass):
     resource_color: Union[str, Tuple[int, int, int], Tuple[int, int, int, int]]
     color: Union[str, Tuple[int, int, int], Tuple[int, int, int, int]]
@@ -32,7 +35,6 @@ class AsteroidViewData(SerializableDataclass):
 
 class AbstractAsteroidView(HealthBarMixin, ABC):
 
-    dust_image = load_image(DUST_PARTICLE_IMAGE)
     view_data: AsteroidViewData
 
     def __init__(
@@ -41,6 +43,17 @@ class AbstractAsteroidView(HealthBarMixin, ABC):
         self.view_data = view_data
         super().__init__(entity, *groups)
 
+    @abstractmethod
+    def render(self) -> pygame.Surface:
+        pass
+
+    def get_rendered(self) -> pygame.Surface:
+        return ImageManager().get_rendered(self.view_data, self.render)
+
+    @property
+    def dust_image(self) -> pygame.Surface:
+        return ImageManager().get_pic(DUST_PARTICLE_IMAGE)
+
     def create_health_bar(self) -> HealthBar:
         return AsteroidHealthBar(Vec2d(-self.w / 2 - 2, -self.h), self.w + 4)
 
@@ -12,9 +12,10 @@ from src.entities.asteroids.abstract import (
     AbstractAsteroid,
     AsteroidViewData,
 )
+from src.utils.image_manager import ImageManager
 
 
-@dataclass
+@dataclass(eq=False)
 class CircleAsteroidViewData(AsteroidViewData):
     circles: List[Tuple[Vec2d, float]]
 
@@ -27,10 +28,21 @@ class CircleAsteroidView(AbstractAsteroidView):
         self.w = self.h = self.view_data.radius * 2
         self.right_top_corner_delta = Vec2d(-self.w / 2, -self.h / 2)
 
-    def draw_image(self, screen: pygame.Surface, pos: Vec2d) -> None:
-        pygame.draw.circle(screen, self.view_data.color, pos, self.view_data.radius)
+    def render(self) -> pygame.Surface:
+        size = math.ceil(self.view_data.radius) + 1
+        center = Vec2d(size, size)
+        surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, self.view_data.color, center, self.view_data.radius)
         for cir_pos, r in self.view_data.circles:
-            pygame.draw.circle(screen, self.view_data.resource_color, cir_pos + pos, r)
+            pygame.draw.circle(
+                surface, self.view_data.resource_color, center + cir_pos, r
+            )
+        return ImageManager().convert(surface)
+
+    def draw_image(self, screen: pygame.Surface, pos: Vec2d) -> None:
+        img = self.get_rendered()
+        x, y = pos
+        screen.blit(img, (x - img.get_width() / 2, y - img.get_height() / 2))
 
 
 class CircleAsteroid(AbstractAsteroid):
@@ -1,12 +1,12 @@
 import math
 from math import cos, pi, sin
-from random import randint, choice
-from typing import List, Tuple
+from random import Random
+from typing import List, Tuple, Optional
 
 import pygame.sprite
 from pymunk import Vec2d
 
-from src.entities.abstract.abstract import EntityFactory
+from src.entities.abstract.abstract import EntityFactory, EntityDescription
 from src.entities.asteroids.abstract import AbstractAsteroid
 from src.entities.asteroids.circle_asteroid import (
     CircleAsteroid,
@@ -22,85 +22,132 @@ from src.utils.polygon_size import get_polygon_size
 
 class AsteroidFactory(EntityFactory):
     @classmethod
-    def create_entity(cls, pos: Vec2d) -> AbstractAsteroid:
-        # Polygon asteroids are too complex, so the game will be slower with them
-        # return cls.create_polygon_asteroid(pos)
-        asteroid = cls.create_circle_asteroid(pos)
-        asteroid.control_body.velocity = Vec2d(randint(-200, 200), randint(-200, 200))
+    def describe_entity(
+        cls, pos: Vec2d, rng: Optional[Random] = None
+    ) -> EntityDescription:
+        rng = rng or Random()
+        if rng.random() < AbstractAsteroid.config.polygon_asteroid_chance:
+            description = cls.describe_polygon_asteroid(pos, rng)
+        else:
+            description = cls.describe_circle_asteroid(pos, rng)
+        description.params["velocity"] = Vec2d(
+            rng.randint(-200, 200), rng.randint(-200, 200)
+        )
+        return description
+
+    @classmethod
+    def create_from_description(
+        cls, description: EntityDescription
+    ) -> AbstractAsteroid:
+        params = description.params
+        asteroid = params["asteroid_class"](
+            pos=description.pos,
+            resource=params["resource"],
+            view_data=params["view_data"],
+        )
+        if "velocity" in params:
+            asteroid.control_body.velocity = params["velocity"]
         return asteroid
 
     @classmethod
-    def create_circle_asteroid(cls, pos: Vec2d):
-        radius = cls.generate_radius()
-        resource = cls.generate_resource(radius)
-        brightness = cls.generate_brightness()
-        circles_count = cls.generate_polygons_count()
-        return CircleAsteroid(
-            pos=pos,
-            resource=resource,
-            view_data=CircleAsteroidViewData(
-                resource_color=resource.resource_type.get_color(),
-                color=(brightness, brightness, brightness),
-                radius=radius,
-                circles=cls.generate_circles(radius, circles_count),
-            ),
+    def create_circle_asteroid(cls, pos: Vec2d, rng: Optional[Random] = None):
+        return cls.create_from_description(cls.describe_circle_asteroid(pos, rng))
+
+    @classmethod
+    def create_polygon_asteroid(cls, pos: Vec2d, rng: Optional[Random] = None):
+        return cls.create_from_description(cls.describe_polygon_asteroid(pos, rng))
+
+    @classmethod
+    def describe_circle_asteroid(
+        cls, pos: Vec2d, rng: Optional[Random] = None
+    ) -> EntityDescription:
+        rng = rng or Random()
+        radius = cls.generate_radius(rng)
+        resource = cls.generate_resource(rng, radius)
+        brightness = cls.generate_brightness(rng)
+        circles_count = cls.generate_polygons_count(rng)
+        return EntityDescription(
+            cls,
+            pos,
+            {
+                "asteroid_class": CircleAsteroid,
+                "resource": resource,
+                "view_data": CircleAsteroidViewData(
+                    resource_color=resource.resource_type.get_color(),
+                    color=(brightness, brightness, brightness),
+                    radius=radius,
+                    circles=cls.generate_circles(rng, radius, circles_count),
+                ),
+            },
         )
 
     @classmethod
-    def create_polygon_asteroid(cls, pos: Vec2d):
-        vertices_count = cls.generate_vertices_count()
-        radius = cls.generate_radius()
-        polygons_count = cls.generate_polygons_count()
+    def describe_polygon_asteroid(
+        cls, pos: Vec2d, rng: Optional[Random] = None
+    ) -> EntityDescription:
+        rng = rng or Random()
+        vertices_count = cls.generate_vertices_count(rng)
+        radius = cls.generate_radius(rng)
+        polygons_count = cls.generate_polygons_count(rng)
         vertices = cls.generate_vertices(
+            rng,
             vertices_count=vertices_count,
             r=radius,
         )
         polygons = cls.generate_polygons_for_polygon_asteroid(
-            vertices_count=vertices_count, r=radius, polygons_count=polygons_count
+            rng, vertices_count=vertices_count, r=radius, polygons_count=polygons_count
         )
-        resource = cls.generate_resource(radius)
-        brightness = cls.generate_brightness()
-        return PolygonAsteroid(
-            pos=pos,
-            resource=resource,
-            view_data=PolygonAsteroidViewData(
-                polygons=polygons,
-                vertices=vertices,
-                resource_color=resource.resource_type.get_color(),
-                color=(brightness, brightness, brightness),
-                radius=radius,
-            ),
+        resource = cls.generate_resource(rng, radius)
+        brightness = cls.generate_brightness(rng)
+        return EntityDescription(
+            cls,
+            pos,
+            {
+                "asteroid_class": PolygonAsteroid,
+                "resource": resource,
+                "view_data": PolygonAsteroidViewData(
+                    polygons=polygons,
+                    vertices=vertices,
+                    resource_color=resource.resource_type.get_color(),
+                    color=(brightness, brightness, brightness),
+                    radius=radius,
+                ),
+            },
         )
 
     @staticmethod
-    def generate_radius() -> float:
-        return randint(*AbstractAsteroid.config.polygon_asteroid_radius_interval)
+    def generate_radius(rng: Random) -> float:
+        return rng.randint(*AbstractAsteroid.config.polygon_asteroid_radius_interval)
 
     @staticmethod
-    def generate_vertices_count() -> int:
-        return randint(*PolygonAsteroid.config.polygon_asteroid_vertices_count)
+    def generate_vertices_count(rng: Random) -> int:
+        return rng.randint(*PolygonAsteroid.config.polygon_asteroid_vertices_count)
 
     @staticmethod
-    def generate_polygons_count() -> int:
-        return randint(*PolygonAsteroid.config.polygon_asteroid_polygons_count)
+    def generate_polygons_count(rng: Random) -> int:
+        return rng.randint(*PolygonAsteroid.config.polygon_asteroid_polygons_count)
 
     @staticmethod
-    def generate_brightness() -> int:
-        return randint(*AbstractAsteroid.config.brightness)
+    def generate_brightness(rng: Random) -> int:
+        return rng.randint(*AbstractAsteroid.config.brightness)
 
     @staticmethod
-    def generate_resource(radius: float) -> Resource:
-        resource_type = choice(list(ResourceType))
-        resource_quantity = radius * randint(100, 200) / 100
+    def generate_resource(rng: Random, radius: float) -> Resource:
+        resource_type = rng.choice(list(ResourceType))
+        resource_quantity = radius * rng.randint(100, 200) / 100
         resource = Resource(quantity=resource_quantity, resource_type=resource_type)
         return resource
 
     @staticmethod
-    def generate_vertices(vertices_count: int, r: float) -> List[Tuple[float, float]]:
+    def generate_vertices(
+        rng: Random, vertices_count: int, r: float
+    ) -> List[Tuple[float, float]]:
         vertices = []
         step = 2 * pi / vertices_count
         for i in range(vertices_count):
-            angle = randint(int(step * i * 100), int(step * (i + 1) * 100)) / 100
+            angle = (
+                rng.randint(int(step * i * 100), int(step * (i + 1) * 100)) / 100
+            )
             vertices.append((r * cos(angle), r * sin(angle)))
         return vertices
 
@@ -113,21 +160,23 @@ class AsteroidFactory(EntityFactory):
 
     @classmethod
     def generate_polygons_for_polygon_asteroid(
-        cls, vertices_count: int, r: float, polygons_count: int
+        cls, rng: Random, vertices_count: int, r: float, polygons_count: int
     ) -> List[List[Tuple[float, float]]]:
         a = 2 * pi / vertices_count
         polygon_radius = cos(a) * r / 2
         polygons = []
         masks = []
         for _ in range(polygons_count):
-            polygon_vertices_count = randint(3, 7)
+            polygon_vertices_count = rng.randint(3, 7)
             vertices = cls.generate_vertices(
-                vertices_count=polygon_vertices_count, r=polygon_radius
+                rng, vertices_count=polygon_vertices_count, r=polygon_radius
             )
             max_attempts = 20
             attempts = 0
 
-            new_vertices = cls.generate_translated_polygon(polygon_radius, vertices)
+            new_vertices = cls.generate_translated_polygon(
+                rng, polygon_radius, vertices
+            )
             mask = cls.get_mask_from_polygon(new_vertices)
 
             while (
@@ -135,7 +184,9 @@ class AsteroidFactory(EntityFactory):
                 and any(mask.overlap(i, (0, 0)) for i in masks)
                 and attempts < max_attempts
             ):
-                new_vertices = cls.generate_translated_polygon(polygon_radius, vertices)
+                new_vertices = cls.generate_translated_polygon(
+                    rng, polygon_radius, vertices
+                )
                 mask = cls.get_mask_from_polygon(new_vertices)
                 attempts += 1
 
@@ -145,7 +196,9 @@ class AsteroidFactory(EntityFactory):
         return polygons
 
     @staticmethod
-    def generate_circles(radius: float, count: int) -> List[Tuple[Vec2d, float]]:
+    def generate_circles(
+        rng: Random, radius: float, count: int
+    ) -> List[Tuple[Vec2d, float]]:
         result = []
 
         (
@@ -153,14 +206,16 @@ class AsteroidFactory(EntityFactory):
             max_inner_radius,
         ) = AbstractAsteroid.config.inner_circle_radius_interval
         for _ in range(count):
-            inner_radius = randint(min_inner_radius * 100, max_inner_radius * 100) / 100
+            inner_radius = (
+                rng.randint(min_inner_radius * 100, max_inner_radius * 100) / 100
+            )
             result.append(
                 (
                     Vec2d(1, 0)
-                    .rotated(randint(0, int(math.pi * 200)) / 100)
+                    .rotated(rng.randint(0, int(math.pi * 200)) / 100)
                     .normalized()
                     * (radius - inner_radius)
-                    * randint(0, 1000)
+                    * rng.randint(0, 1000)
                     / 1000,
                     inner_radius,
                 )
@@ -169,10 +224,10 @@ class AsteroidFactory(EntityFactory):
 
     @staticmethod
     def generate_translated_polygon(
-        polygon_radius: float, polygon: List[Tuple[float, float]]
+        rng: Random, polygon_radius: float, polygon: List[Tuple[float, float]]
     ):
-        dx = randint(0, int(polygon_radius * 100)) / 100
-        dy = randint(0, int(polygon_radius * 100)) / 100
+        dx = rng.randint(0, int(polygon_radius * 100)) / 100
+        dy = rng.randint(0, int(polygon_radius * 100)) / 100
         return [(x + dx, y + dy) for x, y in polygon]
 
     @staticmethod
@@ -9,15 +9,11 @@ from pymunk import Vec2d
 from src.entities.abstract.abstract import EntityView
 from src.entities.asteroids.abstract import AsteroidViewData, AbstractAsteroidView, AbstractAsteroid
 from src.entities.basic_entity.view import PolyBasicView
-from src.utils.get_polygon_verts import apply_rotation_for_verts
+from src.utils.image_manager import ImageManager
 from src.utils.polygon_area import polygon_area
 
-"""
-That works, but too slow.
-"""
 
-
-@dataclass
+@dataclass(eq=False)
 class PolygonAsteroidViewData(AsteroidViewData):
     polygons: List[List[Tuple[float, float]]]
     vertices: List[Tuple[float, float]]
@@ -27,15 +23,24 @@ class PolygonAsteroidView(AbstractAsteroidView, PolyBasicView):
 
     view_data: PolygonAsteroidViewData
 
+    def render(self) -> pygame.Surface:
+        # Not rotated asteroid with its body position in the center
+        size = math.ceil(max(Vec2d(*v).length for v in self.view_data.vertices)) + 2
+        surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        verts = [(x + size, y + size) for x, y in self.view_data.vertices]
+        pygame.draw.polygon(surface, self.view_data.color, verts)
+        pygame.draw.polygon(surface, (0, 0, 0), verts, width=2)
+        for polygon in self.view_data.polygons:
+            verts = [(x + size, y + size) for x, y in polygon]
+            pygame.draw.polygon(surface, self.view_data.resource_color, verts)
+        return ImageManager().convert(surface)
+
     def draw_image(self, screen: pygame.Surface, pos: Vec2d) -> None:
-        verts = apply_rotation_for_verts(
-            self.entity.shape.get_vertices(), self.entity.angle, pos
+        img = ImageManager().get_rotated(
+            self.get_rendered(), self.entity.angle * 180 / -math.pi
         )
-        pygame.draw.polygon(screen, self.view_data.color, verts)
-        pygame.draw.polygon(screen, (0, 0, 0), verts, width=2)
-        for polygon in self.view_data.polygons:
-            verts = apply_rotation_for_verts(polygon, self.entity.angle, pos)
-            pygame.draw.polygon(screen, self.view_data.resource_color, verts)
+        x, y = pos
+        screen.blit(img, (x - img.get_width() / 2, y - img.get_height() / 2))
 
 
 class PolygonAsteroid(AbstractAsteroid):
@@ -1,3 +1,4 @@
+import math
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -10,6 +11,7 @@ from src.entities.entity_configs import PolyEntityConfig, EntityWithFixedMassCon
 from src.entities.modifiers_and_characteristics import (
     LifeCharacteristics,
 )
+from src.settings import RENDER_MARGIN
 from src.utils.body_serialization import *
 from src.utils.signal import Signal, SignalFieldMixin
 
@@ -90,6 +92,17 @@ class BasicEntity(Entity, SignalFieldMixin, ABC):
     def render(self, screen: Surface, camera) -> None:
         self.view.draw(screen, camera.dv + self.position)
 
+    @property
+    def render_radius(self) -> float:
+        # Health bars are drawn above views
+        return math.hypot(self.view.w, self.view.h) / 2 + RENDER_MARGIN
+
+    def drift(self, dt: float) -> None:
+        # Cheap movement without physics for entities which are far from player
+        self.position += self.velocity * dt
+        self.angle += self.angular_velocity * dt
+        self.control_body.position = self.position
+
     def add_to_space(self, space: pymunk.Space) -> None:
         if not self.in_space:
             space.add(self, self.shape)
@@ -28,6 +28,7 @@ from src.entities.pilots.abstract import Pilot
 from src.environment.abstract import get_environment
 from src.settings import get_entity_start_config
 from src.utils.body_serialization import *
+from src.utils.profiler import Profiler
 
 
 class BasicSpaceshipView(PolyBasicView, HealthBarMixin, ExplosiveView, ABC):
@@ -154,7 +155,8 @@ class BasicSpaceship(
 
     def update(self, dt) -> None:
         super().update(dt)
-        self.pilot.update(dt)
+        with Profiler().section("pilots"):
+            self.pilot.update(dt)
         self.weapon.update(dt)
         self.engine.update(dt)
 
@@ -167,20 +169,20 @@ class BasicSpaceship(
             min_prohibited_radius * 0.1
         )  # entities we are going to influence on
         for entity in get_environment().get_entities_near(
-            self.position, min_prohibited_radius + addition_area
+            self.position, min_prohibited_radius + addition_area, PolyBasicEntity
         ):
-            if isinstance(entity, PolyBasicEntity):
-                vec_to_entity = entity.position - self.position
-                normalized, length = vec_to_entity.normalized_and_length()
-                force = (
-                    max(self.velocity_characteristics.max_speed, entity.velocity.length)
-                    / (
-                        (1 - min(length - min_prohibited_radius, 0) / addition_area)
-                        ** 4
-                    )
-                    * dt
-                )
-                self.control_body.velocity -= vec_to_entity.normalized() * force
+            vec_to_entity = entity.position - self.position
+            normalized, length = vec_to_entity.normalized_and_length()
+            force = (
+                max(self.velocity_characteristics.max_speed, entity.velocity.length)
+                / ((1 - min(length - min_prohibited_radius, 0) / addition_area) ** 4)
+                * dt
+            )
+            self.control_body.velocity -= vec_to_entity.normalized() * force
+
+    def drift(self, dt: float) -> None:
+        super().drift(dt)
+        self.weapon.update(dt)
 
     @staticmethod
     def get_characteristics(data: Dict) -> Dict:
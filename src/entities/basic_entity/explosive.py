@@ -28,26 +28,28 @@ class ExplosiveView(BasicView, Updateable, ABC):
         self.time = 0
         self.fps = fps
         self.explosion_radius = explosion_radius
+        # Shared frames of the explosion size, taken when it starts
+        self.explosion_frames = ()
 
     def start_exploding(self):
+        self.explosion_frames = ImageManager().get_explosion_frames(
+            self.explosion_radius
+        )
         self.started_exposing = True
         self.animation_in_process = True
         self.update_explosion_image()
 
     def update(self, dt: float):
         if self.animation_in_process:
-            explosion_frames = ImageManager().explosion_frames()
             self.time += dt
             self.cur_image = int(self.time // (1 / self.fps))
-            if self.cur_image >= len(explosion_frames):
+            if self.cur_image >= len(self.explosion_frames):
                 self.animation_in_process = False
             else:
                 self.update_explosion_image()
 
     def update_explosion_image(self):
-        self.image = ImageManager().explosion_frames(
-            int(self.explosion_radius * 2), int(self.explosion_radius * 2)
-        )[self.cur_image]
+        self.image = self.explosion_frames[self.cur_image]
 
     @property
     def animation_passed(self):
@@ -87,6 +89,16 @@ class Explosive(BasicEntity, ABC):
         if self.exploding and self.view.animation_passed:
             self.is_active = False
 
+    def drift(self, dt: float):
+        super().drift(dt)
+        # Nobody sees explosions there, so dead entities just disappear
+        if not self.is_alive:
+            self.is_active = False
+
+    @property
+    def render_radius(self) -> float:
+        return max(super().render_radius, self.view.explosion_radius)
+
     def explode(self):
         self.control_body.velocity = Vec2d.zero()
         self.die()
@@ -9,6 +9,7 @@ from pymunk import Vec2d
 from src.entities.abstract.abstract import EntityView, Entity
 from src.entities.gadgets.health_bars.abstract import HealthBar
 from src.settings import SHOW_VELOCITY_VECTOR, SHOW_PLAYER_COLLISION_POLY
+from src.utils.image_manager import ImageManager
 from src.utils.get_polygon_verts import apply_rotation_for_verts
 from src.utils.polygon_size import get_polygon_size
 
@@ -32,7 +33,7 @@ class BasicView(EntityView, ABC):
     def draw_image(self, screen: pygame.Surface, pos: Vec2d) -> None:
         if hasattr(self, "image") and self.image is not None:
             x, y = pos
-            img = pygame.transform.rotate(
+            img = ImageManager().get_rotated(
                 self.image, self.entity.angle * 180 / -math.pi
             )
             screen.blit(
@@ -55,6 +55,7 @@ class AsteroidEntityConfig(AbstractEntityConfig):
     polygon_asteroid_radius_interval: Tuple[int, int]
     polygon_asteroid_vertices_count: Tuple[int, int]
     polygon_asteroid_polygons_count: Tuple[int, int]
+    polygon_asteroid_chance: float
     brightness: Tuple[int, int]
     inner_circle_radius_interval: Tuple[int, int]
     frequency: float
@@ -14,8 +14,8 @@ from src.settings import (
     HEALTH_BAR_H,
     HEALTH_BAR_FONT_SIZE,
     HEALTH_BAR_FONT_COLOR,
-    STANDARD_FONT_PATH,
 )
+from src.utils.font_manager import FontManager
 
 
 class DefaultHealthBar(HealthBar, ABC):
@@ -25,7 +25,6 @@ class DefaultHealthBar(HealthBar, ABC):
         self.pos = pos
         self.w = w
         self.h = HEALTH_BAR_H
-        self.font = pygame.font.Font(STANDARD_FONT_PATH, HEALTH_BAR_FONT_SIZE)
 
     def draw_health_line(
         self,
@@ -42,8 +41,10 @@ class DefaultHealthBar(HealthBar, ABC):
             (x - 1, y - 1, self.w + 2, self.h + 2),
         )
         pygame.draw.rect(screen, color, (x, y, self.w * health / max_health, self.h))
-        health_text = self.font.render(
-            f"{round(health)}/{round(max_health)}", False, HEALTH_BAR_FONT_COLOR
+        health_text = FontManager().render(
+            f"{round(health)}/{round(max_health)}",
+            HEALTH_BAR_FONT_SIZE,
+            HEALTH_BAR_FONT_COLOR,
         )
         screen.blit(
             health_text,
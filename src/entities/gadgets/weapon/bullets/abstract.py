@@ -3,7 +3,7 @@ from typing import Dict
 
 from pymunk import Vec2d
 
-from src.entities.abstract.abstract import SaveStrategy
+from src.entities.abstract.abstract import SaveStrategy, Entity
 from src.entities.abstract.guided_entity import AbstractSpaceship
 from src.entities.basic_entity.basic_entity import BasicEntity, EntityWithFixedMass
 from src.entities.basic_entity.basic_spaceship import BasicSpaceshipMixin
@@ -65,6 +65,10 @@ class AbstractBullet(EntityWithFixedMass, BasicSpaceshipMixin, ABC):
             )
         return self._characteristics
 
+    @classmethod
+    def is_loadable(cls, data: Dict) -> bool:
+        return Entity.store[data["spaceship_id"]] is not None
+
     @classmethod
     @abstractmethod
     def new(cls, master: AbstractSpaceship, dpos: Vec2d, direction: Vec2d):
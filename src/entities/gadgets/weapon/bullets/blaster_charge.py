@@ -69,6 +69,10 @@ class BlasterCharge(AbstractBullet, Explosive):
         super().update(dt)
         self.life_characteristics.decrease(dt)
 
+    def drift(self, dt: float):
+        self.life_characteristics.decrease(dt)
+        super().drift(dt)
+
     def on_explode(self):
         env = get_environment()
         sender = self if self.spaceship is None else self.spaceship
@@ -1,11 +1,10 @@
 import pygame
-from pygame import Surface
 from pygame.sprite import AbstractGroup
 from pymunk import Vec2d
 
 from src.entities.basic_entity.explosive import ExplosiveView
 from src.entities.gadgets.weapon.bullets.abstract import AbstractBullet
-from src.settings import load_image
+from src.utils.image_manager import ImageManager
 
 
 class BlasterChargeView(ExplosiveView):
@@ -16,10 +15,7 @@ class BlasterChargeView(ExplosiveView):
     def __init__(self, entity: AbstractBullet, image: str, *groups: AbstractGroup):
         super().__init__(entity, entity.characteristics.explosion_radius, *groups)
         # default image
-        self.image = self.apply_size(load_image(image))
-
-    def apply_size(self, image: Surface, coef: float = 1.0) -> Surface:
-        return pygame.transform.scale(image, (int(self.w * coef), int(self.h * coef)))
+        self.image = ImageManager().get_pic(image, int(self.w), int(self.h))
 
     def init_sizes(self):
         r = self.entity.config.radius
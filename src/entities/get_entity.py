@@ -42,3 +42,7 @@ entities_dict = {i.__name__: i for i in entities_classes}
 
 def entity_from_dict(data: Dict):
     return entities_dict[data["class_name"]].from_dict(data)
+
+
+def entity_is_loadable(data: Dict) -> bool:
+    return entities_dict[data["class_name"]].is_loadable(data)
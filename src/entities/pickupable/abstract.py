@@ -40,3 +40,7 @@ class Pickupable(BasicEntity, ABC):
         self.life_characteristics.decrease(dt)
         if not self.is_alive:
             self.is_active = False
+
+    def drift(self, dt: float) -> None:
+        super().drift(dt)
+        self.update(dt)
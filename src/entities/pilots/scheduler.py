@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Deque, Set
+
+from src.abstract import Updateable
+from src.settings import (
+    SPACESHIP_BOT_PERCEPTION_RATE,
+    SPACESHIP_BOT_PERCEPTIONS_PER_TICK,
+)
+from src.utils.decorators import singleton
+
+
+class ScheduledPerception(ABC):
+    @abstractmethod
+    def perceive(self):
+        pass
+
+    @property
+    @abstractmethod
+    def can_perceive(self) -> bool:
+        pass
+
+
+@singleton
+class PerceptionScheduler(Updateable):
+    # Perceptions are run in order of requests and not more than
+    # perceptions_per_tick at once, so their cost per frame is capped
+
+    period: float
+    perceptions_per_tick: int
+    queue: Deque[ScheduledPerception]
+    queued: Set[ScheduledPerception]
+
+    def __init__(self):
+        self.period = 1 / SPACESHIP_BOT_PERCEPTION_RATE
+        self.perceptions_per_tick = SPACESHIP_BOT_PERCEPTIONS_PER_TICK
+        self.queue = deque()
+        self.queued = set()
+
+    def request(self, perception: ScheduledPerception):
+        if perception not in self.queued:
+            self.queued.add(perception)
+            self.queue.append(perception)
+
+    def update(self, dt: float):
+        for _ in range(min(self.perceptions_per_tick, len(self.queue))):
+            perception = self.queue.popleft()
+            self.queued.discard(perception)
+            if perception.can_perceive:
+                perception.perceive()
+
+    def clear(self):
+        self.queue.clear()
+        self.queued.clear()
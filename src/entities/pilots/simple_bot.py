@@ -4,10 +4,12 @@ from typing import Dict, Optional
 
 from pymunk import Vec2d
 
+from src.entities.abstract.abstract import Entity
 from src.entities.asteroids.abstract import AbstractAsteroid
 from src.entities.basic_entity.basic_spaceship import BasicSpaceship
 from src.entities.pickupable.resource import PickupableResource
 from src.entities.pilots.basic_pilot import BasicPilot
+from src.entities.pilots.scheduler import PerceptionScheduler, ScheduledPerception
 from src.entities.spaceships.miner.miner_mixin import MinerMixin
 from src.entities.teams import Team
 from src.environment.abstract import get_environment
@@ -15,7 +17,12 @@ from src.resources import Resource, ResourceType, Resources
 from src.settings import SPACESHIP_BOT_VISION_RADIUS
 
 
-class SimpleBot(BasicPilot):
+class SimpleBot(BasicPilot, ScheduledPerception):
+
+    target: Optional[BasicSpaceship]
+    pickupable_resource: Optional[PickupableResource]
+    asteroid: Optional[AbstractAsteroid]
+
     def __init__(
         self,
         entity: BasicSpaceship,
@@ -29,6 +36,14 @@ class SimpleBot(BasicPilot):
         self.is_searching = False
         self.searching_direction = None
         self.launched_resources = False
+        self.is_death_handled = False
+
+        # Targets are chosen by PerceptionScheduler, steering uses them every tick
+        self.target = None
+        self.pickupable_resource = None
+        self.asteroid = None
+        self.has_perceived = False
+        self.perception_time = 0
 
     def diy(self):
         for rt in ResourceType:
@@ -46,65 +61,90 @@ class SimpleBot(BasicPilot):
                         PickupableResource(self.entity.position, resource)
                     )
 
-    def update(self, dt: float):
-        self.entity.on_death.connect(self.diy)
+    @property
+    def can_perceive(self) -> bool:
+        return self.entity.is_active and self.entity.is_alive
+
+    def perceive(self):
+        self.has_perceived = True
+        self.perception_time = 0
         env = get_environment()
-        entities_near = env.get_entities_near(
-            self.entity.position, SPACESHIP_BOT_VISION_RADIUS
+        pos = self.entity.position
+        radius = SPACESHIP_BOT_VISION_RADIUS
+
+        # Lower priority targets are looked up only if there is no higher one
+        self.target = env.get_nearest_entity(
+            pos, radius, BasicSpaceship, exclude_team=self.team, exclude=self.entity
         )
-        closest_target = None
-        closest_asteroid = None
-        closest_pickupable_resource = None
-
-        for entity in entities_near:
-            if (
-                isinstance(entity, BasicSpaceship)
-                and entity.team != self.team
-                and entity is not self.entity
-                and (
-                    closest_target is None
-                    or self.entity.position.get_distance(closest_target.position)
-                    > self.entity.position.get_distance(entity.position)
-                )
-            ):
-                closest_target = entity
-            elif (
-                isinstance(entity, AbstractAsteroid)
-                and isinstance(self.entity, MinerMixin)
-                and (
-                    closest_asteroid is None
-                    or self.entity.position.get_distance(closest_asteroid.position)
-                    > self.entity.position.get_distance(entity.position)
-                )
-            ):
-                closest_asteroid = entity
-            elif isinstance(entity, PickupableResource) and (
-                closest_pickupable_resource is None
-                or self.entity.position.get_distance(
-                    closest_pickupable_resource.position
-                )
-                > self.entity.position.get_distance(entity.position)
-            ):
-                closest_pickupable_resource = entity
-
-        if closest_target is not None:
+        self.pickupable_resource = None
+        self.asteroid = None
+        if self.target is None:
+            self.pickupable_resource = env.get_nearest_entity(
+                pos, radius, PickupableResource
+            )
+        if (
+            self.target is None
+            and self.pickupable_resource is None
+            and isinstance(self.entity, MinerMixin)
+        ):
+            self.asteroid = env.get_nearest_entity(pos, radius, AbstractAsteroid)
+
+    @staticmethod
+    def is_valid_target(entity: Optional[Entity]) -> bool:
+        return entity is not None and entity.is_active and entity.is_alive
+
+    def drop_invalid_targets(self) -> bool:
+        dropped = False
+        if self.target is not None and not self.is_valid_target(self.target):
+            self.target = None
+            dropped = True
+        if self.pickupable_resource is not None and not self.is_valid_target(
+            self.pickupable_resource
+        ):
+            self.pickupable_resource = None
+            dropped = True
+        if self.asteroid is not None and not self.is_valid_target(self.asteroid):
+            self.asteroid = None
+            dropped = True
+        return dropped
+
+    def update(self, dt: float):
+        if not self.is_death_handled:
+            self.entity.on_death.connect(self.diy)
+            self.is_death_handled = True
+
+        scheduler = PerceptionScheduler()
+        self.perception_time += dt
+        if (
+            self.drop_invalid_targets()
+            or not self.has_perceived
+            or self.perception_time >= scheduler.period
+        ):
+            scheduler.request(self)
+
+        if self.has_perceived:
+            self.steer(dt)
+        self.entity.engine.rotate_to(dt, self.entity.velocity.angle + math.pi * 0.5)
+
+    def steer(self, dt: float):
+        if self.target is not None:
             pi2 = math.pi * 2
-            self.entity.engine.keep_distance(dt, closest_target.position, 300)
+            self.entity.engine.keep_distance(dt, self.target.position, 300)
             angle = (
-                (closest_target.position - self.entity.position).angle + math.pi * 0.5
+                (self.target.position - self.entity.position).angle + math.pi * 0.5
             ) % pi2
             self.entity.engine.rotate_to(dt, angle)
             if abs(angle - (self.entity.angle % pi2)) < math.pi / 8:
                 self.entity.shoot()
-        elif closest_pickupable_resource is not None:
-            self.entity.engine.move_to(dt, closest_pickupable_resource.position)
-        elif closest_asteroid is not None:
+        elif self.pickupable_resource is not None:
+            self.entity.engine.move_to(dt, self.pickupable_resource.position)
+        elif self.asteroid is not None:
             self.entity.engine.keep_distance(
                 dt,
-                closest_asteroid.position,
+                self.asteroid.position,
                 self.entity.drill.config.mining_distance / 2,
             )
-            self.entity.drill.set_target(closest_asteroid)
+            self.entity.drill.set_target(self.asteroid)
         else:
             if not self.is_searching:
                 self.is_searching = True
@@ -112,7 +152,6 @@ class SimpleBot(BasicPilot):
                     random.random(), random.random()
                 ).normalized()
             self.entity.engine.apply_force(self.searching_direction, dt)
-        self.entity.engine.rotate_to(dt, self.entity.velocity.angle + math.pi * 0.5)
 
     @classmethod
     def from_dict(cls, data: Dict):
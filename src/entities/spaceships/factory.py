@@ -1,8 +1,9 @@
 from pymunk import Vec2d
 
-from src.entities.abstract.abstract import EntityFactory
+from src.entities.abstract.abstract import EntityFactory, EntityDescription
 from src.entities.basic_entity.basic_spaceship import BasicSpaceship
-from random import choice
+from random import Random
+from typing import Optional
 
 from src.entities.spaceships.aliens import *
 from src.entities.spaceships.aquamarins import *
@@ -38,5 +39,14 @@ class SpaceshipFactory(EntityFactory):
     ]
 
     @classmethod
-    def create_entity(cls, pos: Vec2d) -> BasicSpaceship:
-        return choice(cls.spaceships).create_default(pos)
+    def describe_entity(
+        cls, pos: Vec2d, rng: Optional[Random] = None
+    ) -> EntityDescription:
+        rng = rng or Random()
+        return EntityDescription(
+            cls, pos, {"spaceship_class": rng.choice(cls.spaceships)}
+        )
+
+    @classmethod
+    def create_from_description(cls, description: EntityDescription) -> BasicSpaceship:
+        return description.params["spaceship_class"].create_default(description.pos)
@@ -58,6 +58,10 @@ class MinerMixin(AbstractMiner, ABC):
         self.drill.render(screen, camera)
         super().render(screen, camera)
 
+    @property
+    def render_radius(self) -> float:
+        return super().render_radius + self.drill.config.mining_distance
+
     def update(self, dt) -> None:
         super().update(dt)
         self.drill.update(dt)
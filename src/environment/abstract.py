@@ -1,10 +1,12 @@
 from abc import abstractmethod, ABC
-from typing import List
+from typing import List, Optional
 
 from pymunk import Vec2d
 
 from src.entities.abstract.abstract import Entity
+from src.entities.teams import Team
 from src.map.abstract import EntityRegistrator
+from src.map.spatial_hash import EntityClasses
 
 
 class Environment(ABC):
@@ -16,9 +18,36 @@ class Environment(ABC):
         pass
 
     @abstractmethod
-    def get_entities_near(self, pos: Vec2d, radius: float) -> List[Entity]:
+    def get_entities_near(
+        self, pos: Vec2d, radius: float, classes: Optional[EntityClasses] = None
+    ) -> List[Entity]:
         pass
 
+    @abstractmethod
+    def get_nearest_entities(
+        self,
+        pos: Vec2d,
+        radius: float,
+        classes: Optional[EntityClasses] = None,
+        count: int = 1,
+        exclude_team: Optional[Team] = None,
+        exclude: Optional[Entity] = None,
+    ) -> List[Entity]:
+        pass
+
+    def get_nearest_entity(
+        self,
+        pos: Vec2d,
+        radius: float,
+        classes: Optional[EntityClasses] = None,
+        exclude_team: Optional[Team] = None,
+        exclude: Optional[Entity] = None,
+    ) -> Optional[Entity]:
+        entities = self.get_nearest_entities(
+            pos, radius, classes, 1, exclude_team=exclude_team, exclude=exclude
+        )
+        return entities[0] if entities else None
+
     @abstractmethod
     def get_entity_at(self, pos: Vec2d):
         pass
@@ -1,11 +1,13 @@
-from typing import List
+from typing import List, Optional
 
 from pymunk import Vec2d
 
 from src.entities.abstract.abstract import Entity
+from src.entities.teams import Team
 from src.environment.abstract import Environment
 from src.map.abstract import EntityRegistrator
 from src.map.impls import BasicMap
+from src.map.spatial_hash import EntityClasses
 
 
 class BasicEnvironment(Environment):
@@ -18,8 +20,32 @@ class BasicEnvironment(Environment):
     def get_entity_registrator(self) -> EntityRegistrator:
         return self.map_impl
 
-    def get_entities_near(self, pos: Vec2d, radius: float) -> List[Entity]:
-        return self.map_impl.get_entities_near(pos, radius)
+    def get_entities_near(
+        self, pos: Vec2d, radius: float, classes: Optional[EntityClasses] = None
+    ) -> List[Entity]:
+        return self.map_impl.get_entities_near(pos, radius, classes)
+
+    def get_nearest_entities(
+        self,
+        pos: Vec2d,
+        radius: float,
+        classes: Optional[EntityClasses] = None,
+        count: int = 1,
+        exclude_team: Optional[Team] = None,
+        exclude: Optional[Entity] = None,
+    ) -> List[Entity]:
+        predicate = None
+        if exclude_team is not None or exclude is not None:
+
+            def predicate(entity: Entity) -> bool:
+                return entity is not exclude and (
+                    exclude_team is None
+                    or getattr(entity, "team", None) != exclude_team
+                )
+
+        return self.map_impl.get_nearest_entities(
+            pos, radius, count, classes, predicate
+        )
 
     def get_entity_at(self, pos: Vec2d):
         return self.map_impl.get_entity_at(pos)
@@ -1,4 +1,4 @@
-from typing import Type
+from typing import Type, Optional, List
 
 import pygame
 import pygame_gui
@@ -13,7 +13,8 @@ from src.scenes.game_menu_scene import GameMenuScene
 from src.scenes.main_menu_scene import MainMenuScene
 from src.scenes.preview_scene import PreviewScene
 from src.settings import FPS, SIZE, game_exists
-from src.settings import load_game
+from src.settings import stream_game, open_game
+from src.utils.saving import wait_for_saves
 
 
 class Game(Context):
@@ -22,11 +23,15 @@ class Game(Context):
         pygame.mixer.init(channels=32)
         pygame.init()
         self.scene = PreviewScene(self)
+        # Scene drawn by the last frame, a new scene redraws the whole screen
+        self.drawn_scene = None
         self.screen = pygame.display.set_mode(SIZE)
         pygame.display.set_caption("Spaceorro")
 
-    def render(self):
-        self.scene.render(self.screen)
+    def render(self) -> Optional[List[pygame.Rect]]:
+        full = self.scene is not self.drawn_scene
+        self.drawn_scene = self.scene
+        return self.scene.draw(self.screen, full)
 
     def update(self):
         dt = self.clock.get_time() / 1000
@@ -58,11 +63,13 @@ class Game(Context):
         while self.run:
             for event in pygame.event.get():
                 self.catch_event(event)
-            self.screen.fill((0, 0, 0))
-            self.render()
+            changed = self.render()
             self.update()
             self.clock.tick(FPS)
-            pygame.display.flip()
+            if changed is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(changed)
         pygame.quit()
 
     def change_scene(self, sender: Scene, target: Type[Scene], **kwargs):
@@ -75,10 +82,12 @@ class Game(Context):
         self.scene = MainMenuScene(self)
 
     def launch_game_scene(self, save_name: str):
-        if game_exists(save_name):
-            data = load_game(save_name)
-            data["context"] = self
-            self.scene = GameScene.from_dict(data)
+        wait_for_saves()
+        save = open_game(save_name)
+        if save is not None:
+            self.scene = GameScene.from_records(save, self)
+        elif game_exists(save_name):
+            self.scene = GameScene.from_stream(stream_game(save_name), self)
         else:
             self.scene = GameScene(save_name, self)
 
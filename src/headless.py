@@ -0,0 +1,136 @@
+import argparse
+import os
+import random
+import statistics
+import time
+from typing import Dict, List, Optional
+
+import pygame
+from pymunk import Vec2d
+
+from src.entities.basic_entity.basic_spaceship import BasicSpaceship
+from src.entities.pilots.player.player import PlayerPilot
+from src.entities.spaceships.pallarians import PallariansCruiser
+from src.environment.abstract import set_environment
+from src.environment.impl import BasicEnvironment
+from src.map.impls.basic import BasicMap
+from src.scenes.game.camera import Camera
+from src.settings import FPS, SIZE
+from src.utils.profiler import Profiler
+
+SECTIONS = ["bookkeeping", "generation", "space.step", "entities", "pilots", "render"]
+
+
+def init_pygame():
+    # Dummy drivers let views load and convert images without a window or a sound card
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+
+# Same map, environment and player setup as GameScene,
+# but without UI, sounds and the Game loop, and with a fixed dt
+class HeadlessSimulation:
+
+    map: BasicMap
+    player: PlayerPilot
+    player_entity: BasicSpaceship
+
+    def __init__(self, seed: int = 0, dt: float = 1 / FPS, render: bool = False):
+        init_pygame()
+        random.seed(seed)
+        self.seed = seed
+        self.dt = dt
+        self.ticks = 0
+        # Frames are drawn to an off-screen surface of the window size
+        self.screen = pygame.Surface(SIZE).convert() if render else None
+        self.camera = Camera()
+
+        self.map = BasicMap(seed=seed)
+        set_environment(BasicEnvironment(self.map))
+
+        self.player = PlayerPilot()
+        self.player_entity = PallariansCruiser(Vec2d(0, 0), pilot=self.player)
+        # PlayerPilot.set_spaceship also connects sounds, which are not needed here
+        self.player.entity = self.player_entity
+        self.map.add_entity(self.player_entity)
+
+    def tick(self):
+        self.map.update_at(self.player_entity.position, self.dt)
+        if self.screen is not None:
+            with Profiler().section("render"):
+                self.screen.fill("black")
+                self.camera.look_at(self.player_entity)
+                self.map.render_at(self.screen, self.camera, self.player_entity.position)
+        self.ticks += 1
+
+    def run(self, ticks: int, warmup: int = 0) -> List[Dict[str, float]]:
+        profiler = Profiler()
+        for _ in range(warmup):
+            self.tick()
+        profiler.reset()
+        profiler.enabled = True
+        try:
+            for _ in range(ticks):
+                start = time.perf_counter()
+                self.tick()
+                tick = profiler.end_tick()
+                tick["total"] = time.perf_counter() - start
+        finally:
+            profiler.enabled = False
+        return list(profiler.ticks)
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def make_report(ticks: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    report = dict()
+    for name in SECTIONS + ["total"]:
+        values = [tick.get(name, 0.0) * 1000 for tick in ticks]
+        report[name] = {
+            "mean": statistics.fmean(values),
+            "median": statistics.median(values),
+            "p95": percentile(values, 0.95),
+            "max": max(values),
+        }
+    return report
+
+
+def print_report(ticks: List[Dict[str, float]]):
+    report = make_report(ticks)
+    total_time = sum(tick["total"] for tick in ticks)
+    print(f"ticks: {len(ticks)}, ticks per second: {len(ticks) / total_time:.1f}")
+    print(f"{'section':<12}{'mean ms':>10}{'median ms':>12}{'p95 ms':>10}{'max ms':>10}")
+    for name, stats in report.items():
+        print(
+            f"{name:<12}{stats['mean']:>10.3f}{stats['median']:>12.3f}"
+            f"{stats['p95']:>10.3f}{stats['max']:>10.3f}"
+        )
+
+
+def main(args: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Runs the game simulation without display and reports tick timings"
+    )
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--warmup", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dt", type=float, default=1 / FPS)
+    parser.add_argument("--render", action="store_true")
+    parsed = parser.parse_args(args)
+
+    simulation = HeadlessSimulation(
+        seed=parsed.seed, dt=parsed.dt, render=parsed.render
+    )
+    print_report(simulation.run(parsed.ticks, warmup=parsed.warmup))
+
+
+if __name__ == "__main__":
+    main()
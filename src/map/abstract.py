@@ -1,5 +1,5 @@
 from abc import abstractmethod, ABC
-from typing import List, Tuple, Set
+from typing import List, Tuple, Set, Dict, Optional
 
 from pygame import Surface
 from pymunk.vec2d import Vec2d
@@ -7,6 +7,7 @@ from pymunk.vec2d import Vec2d
 from src.abstract import RenderUpdateObject, Serializable
 from src.entities.abstract.abstract import Entity
 from src.scenes.game.camera import Camera
+from src.utils.chunked_file import ChunkedFile
 
 
 class AbstractCluster(Serializable, RenderUpdateObject, ABC):
@@ -25,6 +26,10 @@ class AbstractCluster(Serializable, RenderUpdateObject, ABC):
     def remove_entity(self, entity: Entity):
         pass
 
+    @abstractmethod
+    def drift(self, dt: float):
+        pass
+
 
 class AbstractClustersStore(Serializable, ABC):
     @abstractmethod
@@ -47,6 +52,20 @@ class AbstractClustersStore(Serializable, ABC):
     def __contains__(self, item):
         pass
 
+    @abstractmethod
+    def exists(self, x: int, y: int) -> bool:
+        pass
+
+    @abstractmethod
+    def generate_at(self, x: int, y: int) -> None:
+        pass
+
+
+class AbstractClusterDescription(ABC):
+    @abstractmethod
+    def create(self) -> AbstractCluster:
+        pass
+
 
 class AbstractMapGenerator(ABC):
     @abstractmethod
@@ -55,6 +74,11 @@ class AbstractMapGenerator(ABC):
     ) -> List[AbstractCluster]:
         ...
 
+    # Describing may be done in other threads, so it must not create entities
+    @abstractmethod
+    def describe_clusters(self, x, y) -> List[AbstractClusterDescription]:
+        ...
+
 
 class EntityRegistrator(ABC):
     @abstractmethod
@@ -65,6 +89,8 @@ class EntityRegistrator(ABC):
 class AbstractMap(Serializable, EntityRegistrator, ABC):
     clusters: AbstractClustersStore
     map_generator: AbstractMapGenerator
+    # Whether the last save has all the map, so only changes can be saved
+    synced: bool
 
     @abstractmethod
     def render_at(self, screen: Surface, camera: Camera, pos: Vec2d):
@@ -80,3 +106,18 @@ class AbstractMap(Serializable, EntityRegistrator, ABC):
 
     def contains_entity(self, entity: Entity):
         return entity in self.clusters
+
+    @abstractmethod
+    def to_records(
+        self, only_dirty: bool, exclude: Optional[Set[Entity]] = None
+    ) -> Dict[str, Dict]:
+        pass
+
+    @abstractmethod
+    def mark_saved(self):
+        pass
+
+    @classmethod
+    @abstractmethod
+    def from_records(cls, records: ChunkedFile):
+        pass
@@ -0,0 +1,63 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Tuple, List, Iterable
+
+from src.map.abstract import (
+    AbstractMapGenerator,
+    AbstractClustersStore,
+    AbstractCluster,
+    AbstractClusterDescription,
+)
+from src.settings import MAP_GENERATION_WORKERS
+
+executor = ThreadPoolExecutor(
+    max_workers=MAP_GENERATION_WORKERS, thread_name_prefix="map-generation"
+)
+
+
+class AsyncMapGenerator(AbstractMapGenerator):
+    """
+    Describes clusters in worker threads in advance,
+    entities are created from descriptions on the main thread
+    """
+
+    generator: AbstractMapGenerator
+    pending: Dict[Tuple[int, int], Future]
+
+    def __init__(self, generator: AbstractMapGenerator):
+        self.generator = generator
+        self.pending = dict()
+
+    def describe_clusters(self, x, y) -> List[AbstractClusterDescription]:
+        future = self.pending.pop((x, y), None)
+        if future is not None:
+            return future.result()
+        return self.generator.describe_clusters(x, y)
+
+    def generate_clusters(
+        self, x, y, clusters: AbstractClustersStore
+    ) -> List[AbstractCluster]:
+        return [description.create() for description in self.describe_clusters(x, y)]
+
+    def prefetch(
+        self, positions: Iterable[Tuple[int, int]], clusters: AbstractClustersStore
+    ) -> None:
+        for x, y in positions:
+            if (x, y) not in self.pending and not clusters.exists(x, y):
+                self.pending[x, y] = executor.submit(
+                    self.generator.describe_clusters, x, y
+                )
+
+    def materialize(self, clusters: AbstractClustersStore, budget: float) -> None:
+        # Creates described clusters until the budget (in seconds) is spent,
+        # the rest is left for next frames
+        start = time.perf_counter()
+        for (x, y), future in list(self.pending.items()):
+            if time.perf_counter() - start > budget:
+                return
+            if not future.done():
+                continue
+            if clusters.exists(x, y):
+                del self.pending[x, y]
+            else:
+                clusters.generate_at(x, y)
@@ -1,6 +1,8 @@
-from typing import Dict
+from typing import Dict, Iterable, Tuple, Any
 
 from .basic import BasicMap
+from ...utils.chunked_file import ChunkedFile
+from ...utils.json_stream import Path
 
 
 maps = {BasicMap.__name__: BasicMap}
@@ -8,3 +10,13 @@ maps = {BasicMap.__name__: BasicMap}
 
 def map_from_dict(data: Dict):
     return maps[data["class_name"]].from_dict(data)
+
+
+def map_from_stream(items: Iterable[Tuple[Path, Any]]):
+    # Legacy saves were written only by BasicMap,
+    # and their class name comes after clusters
+    return BasicMap.from_stream(items)
+
+
+def map_from_records(records: ChunkedFile):
+    return maps[records.read("map")["class_name"]].from_records(records)
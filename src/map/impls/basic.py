@@ -1,6 +1,9 @@
 import random
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import IntEnum
 from itertools import product
-from typing import List, Dict, Set, Iterable, Tuple, Optional
+from typing import List, Dict, Set, Iterable, Tuple, Optional, Callable, Any
 
 import pygame.draw
 import pymunk
@@ -8,20 +11,56 @@ from pygame import Surface
 from pymunk import Vec2d, ShapeFilter
 
 from src.entities.basic_entity.basic_entity import PolyBasicEntity
-from src.entities.get_entity import entity_from_dict
-from src.entities.abstract.abstract import Entity, ENTITY_COLLISION, SaveStrategy
+from src.entities.get_entity import entity_from_dict, entity_is_loadable
+from src.entities.abstract.abstract import (
+    Entity,
+    ENTITY_COLLISION,
+    SaveStrategy,
+    EntityDescription,
+)
+from src.entities.asteroids.abstract import AbstractAsteroid
 from src.entities.asteroids.factory import AsteroidFactory
+from src.entities.basic_entity.basic_spaceship import BasicSpaceship
+from src.entities.gadgets.weapon.bullets.abstract import AbstractBullet
 from src.entities.pickupable.abstract import Pickupable
+from src.entities.pilots.abstract import Pilot
+from src.entities.pilots.scheduler import PerceptionScheduler
 from src.entities.spaceships.factory import SpaceshipFactory
 from src.map.abstract import (
     AbstractCluster,
     AbstractMap,
     AbstractMapGenerator,
     AbstractClustersStore,
+    AbstractClusterDescription,
 )
+from src.map.async_generator import AsyncMapGenerator
+from src.map.page_store import ClusterPageStore
+from src.map.spatial_hash import CategorizedSpatialHash, EntityClasses
 from src.scenes.game.camera import Camera
 from src.settings import CLUSTER_SIZE, VISION_DISTANCE, LOG_GENERATING
-from src.settings import SHOW_CLUSTERS_BORDERS
+from src.settings import SPATIAL_HASH_CELL_SIZE, MAP_GENERATION_FRAME_BUDGET
+from src.settings import PAGING_DISTANCE, PAGING_MAX_CLUSTERS, LAZY_LOADING
+from src.utils.chunked_file import ChunkedFile, decode
+from src.utils.json_stream import Path
+from src.settings import (
+    LOD_FULL_DISTANCE,
+    LOD_REDUCED_DISTANCE,
+    LOD_REDUCED_INTERVAL,
+    LOD_DRIFT_INTERVAL,
+)
+from src.settings import SHOW_CLUSTERS_BORDERS, CULLING_MARGIN
+from src.utils.image_manager import ImageManager
+from src.utils.profiler import Profiler
+
+
+def get_max_obj_id(data: Any) -> int:
+    # Greatest id of entities and pilots in serialized data, -1 if none
+    if isinstance(data, dict):
+        result = data.get("obj_id", -1)
+        return max([result, *map(get_max_obj_id, data.values())])
+    if isinstance(data, list):
+        return max(map(get_max_obj_id, data), default=-1)
+    return -1
 
 
 class EntityAlreadyAdded(Exception):
@@ -32,29 +71,52 @@ class EntityNotFound(Exception):
     pass
 
 
-class Cluster(AbstractCluster):
-    dependent_entities_data: List[Dict]
+class LevelOfDetail(IntEnum):
+    # Simulated in the main space every tick
+    FULL = 0
+    # Simulated in a separate space every LOD_REDUCED_INTERVAL ticks
+    REDUCED = 1
+    # Not in any space, entities just drift every LOD_DRIFT_INTERVAL ticks
+    DRIFT = 2
 
-    balls = [
+
+def generate_balls(rng: random.Random, count: int) -> List[Tuple[int, int, int]]:
+    return [
         (
-            random.randint(0, CLUSTER_SIZE[0]),
-            random.randint(0, CLUSTER_SIZE[1]),
-            random.randint(2, 6),
+            rng.randint(0, CLUSTER_SIZE[0]),
+            rng.randint(0, CLUSTER_SIZE[1]),
+            rng.randint(2, 6),
         )
-        for _ in range(100)
+        for _ in range(count)
     ]
 
+
+class Cluster(AbstractCluster):
+    dependent_entities_data: List[Dict]
+    # Pristine cluster is exactly as generated, so it can be generated again
+    # instead of being saved
+    pristine: bool
+    # Dirty cluster has changed since the last save
+    dirty: bool
+
+    balls = generate_balls(random.Random(0), 100)
+    # Balls baked into a tile, which is the same for all clusters
+    starfield: Optional[Surface] = None
+
     def __init__(
         self,
         x: int,
         y: int,
         entities: Optional[Set[Entity]] = None,
         dependent_entities_data: Optional[List[Dict]] = None,
+        pristine: bool = False,
     ):
         if entities is None:
             entities = set()
         self.entities = entities
         self.pos = self.x, self.y = x, y
+        self.pristine = pristine
+        self.dirty = True
         if dependent_entities_data is not None:
             self.dependent_entities_data = dependent_entities_data
 
@@ -62,24 +124,59 @@ class Cluster(AbstractCluster):
         for entity in self.entities.copy():
             entity.update(dt)
 
+    def drift(self, dt: float) -> None:
+        for entity in self.entities.copy():
+            entity.drift(dt)
+
+    @classmethod
+    def get_starfield(cls) -> Surface:
+        if cls.starfield is None:
+            w, h = CLUSTER_SIZE
+            starfield = Surface((w, h))
+            # Balls crossing the tile border continue on the opposite side,
+            # so neighbour tiles are seamless
+            for x, y, r in cls.balls:
+                for ox, oy in product((-w, 0, w), (-h, 0, h)):
+                    pygame.draw.circle(starfield, "white", (x + ox, y + oy), r)
+            cls.starfield = ImageManager().convert(starfield, alpha=False)
+        return cls.starfield
+
+    def render_background(self, screen: Surface, camera: Camera) -> None:
+        w, h = CLUSTER_SIZE
+        screen.blit(self.get_starfield(), camera.dv + Vec2d(self.x * w, self.y * h))
+
     def render(self, screen: Surface, camera: Camera) -> None:
         w, h = CLUSTER_SIZE
         dx, dy = camera.dv + Vec2d(self.x * w, self.y * h)
-        for x, y, r in self.balls:
-            pygame.draw.circle(screen, "white", (dx + x, dy + y), r)
         if SHOW_CLUSTERS_BORDERS:
             pygame.draw.line(screen, "green", (dx, dy), (dx + w, dy))
             pygame.draw.line(screen, "green", (dx + w, dy), (dx + w, dy + h))
             pygame.draw.line(screen, "green", (dx + w, dy + h), (dx, dy + h))
             pygame.draw.line(screen, "green", (dx, dy + h), (dx, dy))
         for entity in self.entities:
-            entity.render(screen, camera)
+            if camera.is_visible(entity.position, entity.render_radius):
+                entity.render(screen, camera)
+
+    def is_visible(self, camera: Camera) -> bool:
+        # Entities are reassigned to clusters with some delay and draw around
+        # themselves, so they may be drawn a bit outside of their cluster
+        w, h = CLUSTER_SIZE
+        return camera.is_rect_visible(
+            self.x * w - CULLING_MARGIN,
+            self.y * h - CULLING_MARGIN,
+            w + 2 * CULLING_MARGIN,
+            h + 2 * CULLING_MARGIN,
+        )
 
     def add_entity(self, entity: Entity) -> None:
         self.entities.add(entity)
+        self.pristine = False
+        self.dirty = True
 
     def remove_entity(self, entity: Entity) -> None:
         self.entities.remove(entity)
+        self.pristine = False
+        self.dirty = True
 
     def extra_entities(self) -> List[Tuple[Entity, int, int]]:
         result = []
@@ -99,21 +196,23 @@ class Cluster(AbstractCluster):
             if not entity.is_active:
                 result.append(entity)
                 self.entities.remove(entity)
+                self.dirty = True
         return result
 
-    def to_dict(self) -> Dict:
+    def to_dict(self, exclude: Optional[Set[Entity]] = None) -> Dict:
+        entities = self.entities if not exclude else self.entities - exclude
         return {
             **super().to_dict(),
             "x": self.x,
             "y": self.y,
             "independent_entities": [
                 entity.to_dict()
-                for entity in self.entities
+                for entity in entities
                 if entity.is_alive and entity.save_strategy == SaveStrategy.ENTITY
             ],
             "dependent_entities": [
                 entity.to_dict()
-                for entity in self.entities
+                for entity in entities
                 if entity.is_alive and entity.save_strategy == SaveStrategy.DEPENDED
             ],
         }
@@ -130,9 +229,26 @@ class Cluster(AbstractCluster):
         )
         return cluster
 
-    def load_depended_entities(self):
-        for entity in self.dependent_entities_data:
-            self.entities.add(entity_from_dict(entity))
+    def load_depended_entities(self) -> List[Entity]:
+        # Data of entities which depend on not loaded ones is kept for later
+        loaded, remaining = [], []
+        for data in self.dependent_entities_data:
+            if entity_is_loadable(data):
+                loaded.append(entity_from_dict(data))
+            else:
+                remaining.append(data)
+        self.entities.update(loaded)
+        self.dependent_entities_data = remaining
+        return loaded
+
+    def unload(self) -> None:
+        # Releases entities from stores, so nothing keeps them in memory
+        # and nobody takes them for existing ones
+        for entity in self.entities:
+            entity.is_active = False
+            pilot = getattr(entity, "pilot", None)
+            if pilot is not None:
+                pilot.store.remove(pilot.obj_id)
 
     def __hash__(self) -> int:
         return hash(self.pos)
@@ -152,20 +268,55 @@ class Cluster(AbstractCluster):
         return False
 
 
+@dataclass
+class ClusterDescription(AbstractClusterDescription):
+    x: int
+    y: int
+    entities: List[EntityDescription]
+
+    def create(self) -> Cluster:
+        return Cluster(
+            self.x,
+            self.y,
+            entities={entity.create() for entity in self.entities},
+            pristine=True,
+        )
+
+
 class ClustersStore(AbstractClustersStore):
     lines: Dict[int, Dict[int, Cluster]]
+    # Clusters which are not in memory
+    pages: ClusterPageStore
+    # Positions of clusters in memory from least to most recently used
+    usage: OrderedDict
+    # Pages of clusters which have changed since the last save
+    dirty_pages: Set[Tuple[int, int]]
+    # Compressed records of saved clusters which are not loaded yet
+    saved_chunks: Dict[Tuple[int, int], bytes]
+    # Clusters loaded from saves, whose bullets wait for their spaceships
+    pending_dependents: Dict[Tuple[int, int], Cluster]
 
     def __init__(self, generator: AbstractMapGenerator):
         self.lines = dict()
         self.generator = generator
+        self.pages = ClusterPageStore()
+        self.usage = OrderedDict()
+        self.dirty_pages = set()
+        self.saved_chunks = dict()
+        self.pending_dependents = dict()
 
     def __getitem__(self, item) -> Cluster:
         x, y = item
         if isinstance(x, int) and isinstance(y, int):
-            if not self.exists(x, y):
+            if not self.is_loaded(x, y):
                 if not hasattr(self, "lol"):
                     self.lol = 12
-                self.generate_at(x, y)
+                if (x, y) in self.pages:
+                    self.load_page(x, y)
+                elif (x, y) in self.saved_chunks:
+                    self.load_saved(x, y)
+                else:
+                    self.generate_at(x, y)
             return self.lines[y][x]
         raise TypeError(f"Attempt to use {type(item[0])} as key")
 
@@ -175,6 +326,7 @@ class ClustersStore(AbstractClustersStore):
             if y not in self.lines:
                 self.lines[y] = dict()
             self.lines[y][x] = value
+            self.touch(x, y)
             return
         raise TypeError
 
@@ -193,8 +345,86 @@ class ClustersStore(AbstractClustersStore):
             self[cx, cy] = new_cluster
 
     def exists(self, x: int, y: int) -> bool:
+        return (
+            self.is_loaded(x, y)
+            or (x, y) in self.pages
+            or (x, y) in self.saved_chunks
+        )
+
+    def is_loaded(self, x: int, y: int) -> bool:
         return y in self.lines and x in self.lines[y]
 
+    def touch(self, x: int, y: int) -> None:
+        self.usage[x, y] = None
+        self.usage.move_to_end((x, y))
+
+    def load_page(self, x: int, y: int) -> None:
+        cluster = Cluster.from_dict(self.pages.pop(x, y))
+        cluster.load_depended_entities()
+        cluster.dirty = (x, y) in self.dirty_pages
+        self.dirty_pages.discard((x, y))
+        self[x, y] = cluster
+
+    def load_saved(self, x: int, y: int) -> None:
+        cluster = Cluster.from_dict(decode(self.saved_chunks.pop((x, y))))
+        cluster.dirty = False
+        self[x, y] = cluster
+        self.pending_dependents[x, y] = cluster
+
+    def add_saved(self, cluster: Cluster) -> None:
+        # Its bullets are loaded with map updates, after their spaceships
+        self[cluster.x, cluster.y] = cluster
+        self.pending_dependents[cluster.x, cluster.y] = cluster
+
+    def load_pending_dependents(self) -> List[Tuple[Tuple[int, int], List[Entity]]]:
+        result = []
+        for pos, cluster in list(self.pending_dependents.items()):
+            entities = cluster.load_depended_entities()
+            if entities:
+                result.append((pos, entities))
+            if not cluster.dependent_entities_data:
+                del self.pending_dependents[pos]
+        return result
+
+    def unload(self, x: int, y: int) -> None:
+        cluster = self.lines[y].pop(x)
+        if not self.lines[y]:
+            del self.lines[y]
+        del self.usage[x, y]
+        self.pending_dependents.pop((x, y), None)
+        # Pristine clusters are generated again when needed
+        if not cluster.pristine:
+            data = cluster.to_dict()
+            # Bullets need their spaceships on loading, which may be unloaded
+            # by that time, and they would expire anyway
+            data["dependent_entities"] = []
+            self.pages.write(x, y, data)
+            if cluster.dirty:
+                self.dirty_pages.add((x, y))
+        cluster.unload()
+
+    def evict(self, center: Tuple[int, int], distance: int, max_count: int) -> None:
+        # Unloads clusters farther than distance from center, then least recently
+        # used ones while there are more than max_count, but never inside distance
+        cx, cy = center
+        far = [
+            (x, y)
+            for x, y in self.usage
+            if max(abs(x - cx), abs(y - cy)) > distance
+        ]
+        excess = len(self.usage) - max_count
+        for x, y in far:
+            self.unload(x, y)
+        excess -= len(far)
+        if excess <= 0:
+            return
+        for x, y in list(self.usage):
+            if excess <= 0:
+                break
+            if max(abs(x - cx), abs(y - cy)) > VISION_DISTANCE + 1:
+                self.unload(x, y)
+                excess -= 1
+
     def keys(self) -> List[Tuple[int, int]]:
         return [(x, y) for y, val in self.lines.items() for x in val.keys()]
 
@@ -202,17 +432,46 @@ class ClustersStore(AbstractClustersStore):
         return [cluster for line in self.lines.values() for cluster in line.values()]
 
     def to_dict(self) -> Dict:
-        return {
-            **super().to_dict(),
-            "lines": {
-                y: {x: cluster.to_dict() for x, cluster in line.items()}
-                for y, line in self.lines.items()
-            },
+        lines = {
+            y: {
+                x: cluster.to_dict()
+                for x, cluster in line.items()
+                if not cluster.pristine
+            }
+            for y, line in self.lines.items()
+        }
+        for (x, y), data in self.pages.items():
+            lines.setdefault(y, dict())[x] = data
+        for (x, y), chunk in self.saved_chunks.items():
+            lines.setdefault(y, dict())[x] = decode(chunk)
+        return {**super().to_dict(), "lines": lines}
+
+    def get_clusters_data(
+        self, only_dirty: bool, exclude: Optional[Set[Entity]] = None
+    ) -> Dict[Tuple[int, int], Dict]:
+        result = {
+            cluster.pos: cluster.to_dict(exclude)
+            for cluster in self.values()
+            if not cluster.pristine and (cluster.dirty or not only_dirty)
         }
+        for x, y in self.dirty_pages if only_dirty else self.pages.pages:
+            result[x, y] = self.pages.read(x, y)
+        # Not loaded saved clusters have not changed
+        if not only_dirty:
+            for pos, chunk in self.saved_chunks.items():
+                result[pos] = decode(chunk)
+        return result
+
+    def mark_saved(self) -> None:
+        for cluster in self.values():
+            cluster.dirty = False
+        self.dirty_pages.clear()
 
     @classmethod
-    def from_dict(cls, data: Dict):
-        store = ClustersStore(BasicMapGenerator())
+    def from_dict(cls, data: Dict, generator: Optional[AbstractMapGenerator] = None):
+        if generator is None:
+            generator = BasicMapGenerator(random.getrandbits(32))
+        store = ClustersStore(generator)
         store.lines = {
             int(y): {
                 int(x): Cluster.from_dict(ser_cluster)
@@ -235,38 +494,92 @@ class ClustersStore(AbstractClustersStore):
 
 
 class BasicMapGenerator(AbstractMapGenerator):
+    """
+    Cluster contents depend only on the world seed and cluster position,
+    so clusters can be generated in any order and generated again
+    """
+
+    seed: int
+
+    def __init__(self, seed: int):
+        self.seed = seed
+
+    def get_random(self, x: int, y: int) -> random.Random:
+        return random.Random(f"{self.seed}:{x}:{y}")
+
     # TODO make generation more complex
     def generate_clusters(
         self, x: int, y: int, clusters: ClustersStore
     ) -> List[AbstractCluster]:
+        return [description.create() for description in self.describe_clusters(x, y)]
+
+    def describe_clusters(self, x: int, y: int) -> List[ClusterDescription]:
         if LOG_GENERATING:
             print(f"generated at {x}, {y}")
+        rng = self.get_random(x, y)
         w, h = CLUSTER_SIZE
-        entities = set()
-        for _ in range(random.randint(1, 5)):
-            entity_x = random.randint(w * x, w * (x + 1))
-            entity_y = random.randint(h * y, h * (y + 1))
-            entities.add(AsteroidFactory.create_entity(Vec2d(entity_x, entity_y)))
-        if random.random() < 0.1:
-            entity_x = random.randint(w * x, w * (x + 1))
-            entity_y = random.randint(h * y, h * (y + 1))
-            e = SpaceshipFactory.create_entity(Vec2d(entity_x, entity_y))
-            entities.add(e)
-        return [Cluster(x, y, entities=entities)]
+        entities = []
+        for _ in range(rng.randint(1, 5)):
+            entity_x = rng.randint(w * x, w * (x + 1))
+            entity_y = rng.randint(h * y, h * (y + 1))
+            entities.append(
+                AsteroidFactory.describe_entity(Vec2d(entity_x, entity_y), rng)
+            )
+        if rng.random() < 0.1:
+            entity_x = rng.randint(w * x, w * (x + 1))
+            entity_y = rng.randint(h * y, h * (y + 1))
+            entities.append(
+                SpaceshipFactory.describe_entity(Vec2d(entity_x, entity_y), rng)
+            )
+        return [ClusterDescription(x, y, entities)]
 
 
 class BasicMap(AbstractMap):
-    active_clusters: Set[Cluster]
-
-    def __init__(self):
-        self.map_generator = BasicMapGenerator()
+    CLUSTER_RECORD_PREFIX = "cluster:"
+
+    # Cluster where the active window is centered
+    center: Optional[Tuple[int, int]]
+    # Active clusters and their levels of detail are keyed by positions,
+    # so lookups do not compare clusters
+    active_clusters: Dict[Tuple[int, int], Cluster]
+    clusters_lod: Dict[Tuple[int, int], LevelOfDetail]
+    lod_clusters: Dict[LevelOfDetail, Dict[Tuple[int, int], Cluster]]
+    spaces: Dict[LevelOfDetail, pymunk.Space]
+    entities_index: CategorizedSpatialHash
+
+    INDEX_CATEGORIES = (BasicSpaceship, AbstractAsteroid, Pickupable, AbstractBullet)
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = random.getrandbits(32)
+        self.seed = seed
+        self.synced = False
+        self.map_generator = AsyncMapGenerator(BasicMapGenerator(seed))
         self.clusters = ClustersStore(self.map_generator)
-        self.active_clusters = set()
-        self.space = pymunk.Space()
-        self.space.collision_slop = 0.5
+        self.center = None
+        self.active_clusters = dict()
+        self.clusters_lod = dict()
+        self.lod_clusters = {level: dict() for level in LevelOfDetail}
+        self.space = self.create_space()
+        self.reduced_space = self.create_space()
+        self.spaces = {
+            LevelOfDetail.FULL: self.space,
+            LevelOfDetail.REDUCED: self.reduced_space,
+        }
+        self.ticks = 0
+        self.reduced_dt = 0
+        self.drift_dt = 0
+        # Entities which are in spaces, indexed for fast neighbour queries
+        self.entities_index = CategorizedSpatialHash(
+            SPATIAL_HASH_CELL_SIZE, self.INDEX_CATEGORIES
+        )
 
-        handler = self.space.add_collision_handler(ENTITY_COLLISION, ENTITY_COLLISION)
+    def create_space(self) -> pymunk.Space:
+        space = pymunk.Space()
+        space.collision_slop = 0.5
+        handler = space.add_collision_handler(ENTITY_COLLISION, ENTITY_COLLISION)
         handler.begin = self.collision
+        return space
 
     @staticmethod
     def collision(arbiter: pymunk.Arbiter, space: pymunk.Space, data: Dict) -> bool:
@@ -280,71 +593,238 @@ class BasicMap(AbstractMap):
             s2.body, PolyBasicEntity
         )
 
-    def update_active_clusters(self, clusters: Set[Cluster]) -> None:
-        for cluster in self.active_clusters - clusters:
-            self.delete_entities_from_space(cluster.entities)
-        for cluster in clusters - self.active_clusters:
-            self.add_entities_to_space(cluster.entities)
-        self.active_clusters = clusters
+    @staticmethod
+    def get_level_of_detail(dx: int, dy: int) -> Optional[LevelOfDetail]:
+        distance = max(abs(dx), abs(dy))
+        if distance <= LOD_FULL_DISTANCE:
+            return LevelOfDetail.FULL
+        if distance <= LOD_REDUCED_DISTANCE:
+            return LevelOfDetail.REDUCED
+        if distance <= VISION_DISTANCE:
+            return LevelOfDetail.DRIFT
+        return None
+
+    @staticmethod
+    def get_square(center: Tuple[int, int], radius: int) -> List[Tuple[int, int]]:
+        x, y = center
+        return [
+            (x + dx, y + dy)
+            for dx, dy in product(range(-radius, radius + 1), repeat=2)
+        ]
+
+    @staticmethod
+    def get_window_difference(
+        a: Tuple[int, int], b: Tuple[int, int]
+    ) -> List[Tuple[int, int]]:
+        # Clusters of the window around a which are not in the window around b.
+        # When centers are neighbours, it is a row and/or a column
+        bx, by = b
+        return [
+            (x, y)
+            for x, y in BasicMap.get_square(a, VISION_DISTANCE)
+            if abs(x - bx) > VISION_DISTANCE or abs(y - by) > VISION_DISTANCE
+        ]
+
+    def update_active_clusters(self, x: int, y: int) -> None:
+        old_center, center = self.center, (x, y)
+        if center == old_center:
+            return
+        self.center = center
+        # Clusters of the next ring are described in advance,
+        # so crossing a border does not wait for generation
+        self.map_generator.prefetch(
+            self.get_square(center, VISION_DISTANCE + 1), self.clusters
+        )
+        if old_center is None:
+            for pos in self.get_square(center, VISION_DISTANCE):
+                self.update_cluster_lod(pos)
+        else:
+            for pos in self.get_window_difference(old_center, center):
+                self.update_cluster_lod(pos)
+            for pos in self.get_window_difference(center, old_center):
+                self.update_cluster_lod(pos)
+            # Level of detail changes only near both centers,
+            # outer clusters stay drifting
+            near = set(self.get_square(old_center, LOD_REDUCED_DISTANCE))
+            near.update(self.get_square(center, LOD_REDUCED_DISTANCE))
+            for pos in near:
+                self.update_cluster_lod(pos)
+
+        # Bullets of loaded clusters are loaded when their spaceships are
+        for pos, entities in self.clusters.load_pending_dependents():
+            self.place_entities(entities, self.clusters_lod.get(pos))
+
+        for cx, cy in self.active_clusters:
+            self.clusters.touch(cx, cy)
+        self.clusters.evict(
+            center, max(PAGING_DISTANCE, VISION_DISTANCE + 1), PAGING_MAX_CLUSTERS
+        )
+
+    def update_cluster_lod(self, pos: Tuple[int, int]) -> None:
+        cx, cy = self.center
+        level = self.get_level_of_detail(pos[0] - cx, pos[1] - cy)
+        old_level = self.clusters_lod.get(pos)
+        if level == old_level:
+            return
+        if old_level is None:
+            cluster = self.clusters[pos]
+            cluster.pristine = False
+            # Active clusters change every frame
+            cluster.dirty = True
+            self.active_clusters[pos] = cluster
+        else:
+            cluster = self.active_clusters[pos]
+            del self.lod_clusters[old_level][pos]
+        if level is None:
+            del self.active_clusters[pos]
+            del self.clusters_lod[pos]
+        else:
+            self.clusters_lod[pos] = level
+            self.lod_clusters[level][pos] = cluster
+        self.place_entities(cluster.entities, level)
+
+    def add_to_space(self, entity: Entity, space: pymunk.Space) -> None:
+        entity.add_to_space(space)
+        self.entities_index.insert(entity)
+
+    def remove_from_space(self, entity: Entity) -> None:
+        if entity.space is not None:
+            entity.remove_from_space(entity.space)
+        self.entities_index.remove(entity)
+
+    def place_entity(self, entity: Entity, level: Optional[LevelOfDetail]) -> None:
+        # Moves entity to the space of the level, entities of drifting
+        # and inactive clusters are not in any space
+        space = self.spaces.get(level)
+        if entity.in_space and entity.space is space:
+            return
+        if entity.in_space:
+            self.remove_from_space(entity)
+        if space is not None and entity.is_alive:
+            self.add_to_space(entity, space)
 
-    def add_entities_to_space(self, entities: Iterable[Entity]) -> None:
+    def place_entities(
+        self, entities: Iterable[Entity], level: Optional[LevelOfDetail]
+    ) -> None:
         for entity in entities:
-            if not entity.in_space:
-                entity.add_to_space(self.space)
+            self.place_entity(entity, level)
 
     def delete_entities_from_space(self, entities: Iterable[Entity]) -> None:
         for entity in entities:
-            entity.remove_from_space(self.space)
+            if entity.in_space:
+                self.remove_from_space(entity)
 
     @staticmethod
     def determine_cluster(pos: Vec2d) -> Tuple[int, int]:
         w, h = CLUSTER_SIZE
         return int(pos.x // w), int(pos.y // h)
 
-    def get_clusters_near(self, x: int, y: int) -> Set[Cluster]:
-        result = set()
-        for dx, dy in product(range(-VISION_DISTANCE, VISION_DISTANCE + 1), repeat=2):
-            cluster = self.clusters[x + dx, y + dy]
-            result.add(cluster)
-        return result
-
     def render_at(self, screen: Surface, camera: Camera, pos: Vec2d) -> None:
-        self.update_active_clusters(
-            self.get_clusters_near(*self.determine_cluster(pos))
-        )
-        for cluster in self.active_clusters:
+        self.update_active_clusters(*self.determine_cluster(pos))
+        visible = [
+            cluster
+            for cluster in self.active_clusters.values()
+            if cluster.is_visible(camera)
+        ]
+        # Backgrounds go first, so they do not cover entities of other clusters
+        for cluster in visible:
+            cluster.render_background(screen, camera)
+        for cluster in visible:
             cluster.render(screen, camera)
 
     def update_at(self, pos: Vec2d, dt: float) -> None:
-        self.update_active_clusters(
-            self.get_clusters_near(*self.determine_cluster(pos))
-        )
-        entities_for_delete = []
-        for cluster in self.active_clusters:
+        profiler = Profiler()
+        with profiler.section("bookkeeping"):
+            self.update_active_clusters(*self.determine_cluster(pos))
+            self.update_clusters_bookkeeping()
+        with profiler.section("generation"):
+            self.map_generator.materialize(self.clusters, MAP_GENERATION_FRAME_BUDGET)
+        with profiler.section("pilots"):
+            PerceptionScheduler().update(dt)
+
+        # Far clusters accumulate time and are updated with a larger dt.
+        # Drift updates are shifted by half an interval from reduced ones,
+        # so they do not happen at the same tick
+        self.ticks += 1
+        self.reduced_dt += dt
+        self.drift_dt += dt
+        update_reduced = self.ticks % LOD_REDUCED_INTERVAL == 0
+        update_drift = self.ticks % LOD_DRIFT_INTERVAL == LOD_DRIFT_INTERVAL // 2
+
+        with profiler.section("space.step"):
+            self.space.step(dt)
+            if update_reduced:
+                self.reduced_space.step(self.reduced_dt)
+        with profiler.section("bookkeeping"):
+            self.entities_index.update_all()
+        with profiler.section("entities"):
+            for cluster in self.lod_clusters[LevelOfDetail.FULL].values():
+                cluster.update(dt)
+            if update_reduced:
+                for cluster in self.lod_clusters[LevelOfDetail.REDUCED].values():
+                    cluster.update(self.reduced_dt)
+                self.reduced_dt = 0
+            if update_drift:
+                for cluster in self.lod_clusters[LevelOfDetail.DRIFT].values():
+                    cluster.drift(self.drift_dt)
+                self.drift_dt = 0
+
+    def update_clusters_bookkeeping(self) -> None:
+        entities_for_placing = []
+        for pos, cluster in self.active_clusters.items():
             for entity in cluster.dead_entities():
-                entity.remove_from_space(self.space)
+                self.remove_from_space(entity)
             for entity in cluster.pop_inactive_entities():
                 if entity.in_space:
-                    entity.remove_from_space(self.space)
+                    self.remove_from_space(entity)
             for entity, x, y in cluster.extra_entities():
                 self.clusters[x, y].add_entity(entity)
                 cluster.remove_entity(entity)
-                if self.clusters[x, y] not in self.active_clusters:
-                    entities_for_delete.append(entity)
-        self.delete_entities_from_space(entities_for_delete)
-        self.space.step(dt)
-        for cluster in self.active_clusters:
-            cluster.update(dt)
+                level = self.clusters_lod.get((x, y))
+                if level != self.clusters_lod[pos]:
+                    entities_for_placing.append((entity, level))
+        for entity, level in entities_for_placing:
+            self.place_entity(entity, level)
 
     def to_dict(self) -> Dict:
-        return {"clusters": self.clusters.to_dict(), **super().to_dict()}
+        return {
+            "seed": self.seed,
+            "clusters": self.clusters.to_dict(),
+            **super().to_dict(),
+        }
+
+    def to_records(
+        self, only_dirty: bool, exclude: Optional[Set[Entity]] = None
+    ) -> Dict[str, Dict]:
+        clusters_data = self.clusters.get_clusters_data(only_dirty, exclude)
+        records = {
+            f"{self.CLUSTER_RECORD_PREFIX}{x}:{y}": data
+            for (x, y), data in clusters_data.items()
+        }
+        # Not loaded clusters of lazily loaded saves keep their ids reserved
+        records["map"] = {
+            "seed": self.seed,
+            "next_ids": {
+                "entities": Entity.store.current_id,
+                "pilots": Pilot.store.current_id,
+            },
+            **super().to_dict(),
+        }
+        return records
+
+    def mark_saved(self) -> None:
+        self.clusters.mark_saved()
+        # Active clusters change every frame
+        for cluster in self.active_clusters.values():
+            cluster.dirty = True
+        self.synced = True
 
     def add_entity(self, entity: Entity) -> None:
         if entity in self.clusters:
             raise EntityAlreadyAdded
         cx, cy = self.determine_cluster(entity.position)
         self.clusters[cx, cy].add_entity(entity)
-        entity.add_to_space(self.space)
+        self.place_entity(entity, self.clusters_lod.get((cx, cy)))
 
     def remove_entity(self, entity: Entity) -> None:
         if entity not in self.clusters:
@@ -352,32 +832,86 @@ class BasicMap(AbstractMap):
         cx, cy = self.determine_cluster(entity.position)
         self.clusters[cx, cy].remove_entity(entity)
         if entity.in_space:
-            entity.remove_from_space(self.space)
+            self.remove_from_space(entity)
 
     @classmethod
     def from_dict(cls, data: Dict):
-        basic_map = BasicMap()
-        basic_map.clusters = ClustersStore.from_dict(data["clusters"])
+        # Saves without seed have all clusters, so any seed fits them
+        basic_map = BasicMap(seed=data.get("seed"))
+        basic_map.clusters = ClustersStore.from_dict(
+            data["clusters"], basic_map.map_generator
+        )
         return basic_map
 
-    def get_entities_near(self, pos: Vec2d, radius: float):
-        # That realization don`t make projections on shapes of entities
-        # So, I decided to use native method of pymunk.Space, but it works only with shapes
-        # which are inside space. However, only some entities are included in space for optimisation
-        # Maybe, I`ll make it better in far future :)
-        #
-        # from src.utils.funcs import rects_overlapped_by_circle
-        # w, h = CLUSTER_SIZE
-        # res = []
-        # for x, y in rects_overlapped_by_circle(w, h, pos, radius):
-        #     for entity in self.clusters[x, y].entities:
-        #         if entity.position.get_distance(pos) <= radius:
-        #             res.append(entity)
-        # return res
-        res = []
-        for query_info in self.space.point_query(pos, radius, ShapeFilter()):
-            res.append(query_info.shape.body)
-        return res
+    @classmethod
+    def from_stream(cls, items: Iterable[Tuple[Path, Any]]):
+        # Legacy saves have seed after clusters, so clusters are built first
+        data = dict()
+        clusters = ClustersStore(generator=None)
+        for path, value in items:
+            if path[:2] == ("clusters", "lines"):
+                clusters.add_saved(Cluster.from_dict(value))
+            else:
+                data[path] = value
+        basic_map = BasicMap(seed=data.get(("seed",)))
+        clusters.generator = basic_map.map_generator
+        basic_map.clusters = clusters
+        return basic_map
+
+    @classmethod
+    def get_cluster_position(cls, key: str) -> Tuple[int, int]:
+        x, y = key[len(cls.CLUSTER_RECORD_PREFIX) :].split(":")
+        return int(x), int(y)
+
+    @classmethod
+    def from_records(cls, records: ChunkedFile, lazy: bool = LAZY_LOADING):
+        keys = [
+            key for key in records.keys() if key.startswith(cls.CLUSTER_RECORD_PREFIX)
+        ]
+        data = records.read("map")
+        if lazy:
+            # Clusters are created when they are accessed for the first time
+            basic_map = BasicMap(seed=data.get("seed"))
+            basic_map.clusters.saved_chunks = {
+                cls.get_cluster_position(key): chunk
+                for key, chunk in records.read_raw_many(keys)
+            }
+            # Ids of not loaded entities must not be given to new ones
+            if "next_ids" in data:
+                Entity.store.reserve(data["next_ids"]["entities"] - 1)
+                Pilot.store.reserve(data["next_ids"]["pilots"] - 1)
+            else:
+                chunks = basic_map.clusters.saved_chunks.values()
+                max_id = max(map(get_max_obj_id, map(decode, chunks)), default=-1)
+                Entity.store.reserve(max_id)
+                Pilot.store.reserve(max_id)
+        else:
+            lines = dict()
+            for key, cluster in records.read_many(keys):
+                x, y = cls.get_cluster_position(key)
+                lines.setdefault(y, dict())[x] = cluster
+            basic_map = cls.from_dict({**data, "clusters": {"lines": lines}})
+        basic_map.mark_saved()
+        return basic_map
+
+    def get_entities_near(
+        self,
+        pos: Vec2d,
+        radius: float,
+        classes: Optional[EntityClasses] = None,
+    ) -> List[Entity]:
+        # Shapes are approximated by their bounding circles
+        return self.entities_index.query(pos, radius, classes)
+
+    def get_nearest_entities(
+        self,
+        pos: Vec2d,
+        radius: float,
+        count: int = 1,
+        classes: Optional[EntityClasses] = None,
+        predicate: Optional[Callable[[Entity], bool]] = None,
+    ) -> List[Entity]:
+        return self.entities_index.nearest(pos, radius, count, classes, predicate)
 
     def get_entity_at(self, pos: Vec2d):
         res = self.space.point_query_nearest(pos, 0, ShapeFilter())
@@ -0,0 +1,48 @@
+import json
+import os
+import tempfile
+import zlib
+from typing import Dict, Set, Tuple, Optional, Iterator
+
+
+class ClusterPageStore:
+    """
+    Keeps serialized clusters in compressed files of a temporary directory
+    """
+
+    directory: Optional[tempfile.TemporaryDirectory]
+    pages: Set[Tuple[int, int]]
+
+    def __init__(self):
+        self.directory = None
+        self.pages = set()
+
+    def get_path(self, x: int, y: int) -> str:
+        if self.directory is None:
+            self.directory = tempfile.TemporaryDirectory(prefix="spaceorro-clusters-")
+        return os.path.join(self.directory.name, f"{x}_{y}.json.z")
+
+    def __contains__(self, pos: Tuple[int, int]) -> bool:
+        return pos in self.pages
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def write(self, x: int, y: int, data: Dict) -> None:
+        with open(self.get_path(x, y), "wb") as w:
+            w.write(zlib.compress(json.dumps(data).encode("utf-8")))
+        self.pages.add((x, y))
+
+    def read(self, x: int, y: int) -> Dict:
+        with open(self.get_path(x, y), "rb") as r:
+            return json.loads(zlib.decompress(r.read()).decode("utf-8"))
+
+    def pop(self, x: int, y: int) -> Dict:
+        data = self.read(x, y)
+        os.remove(self.get_path(x, y))
+        self.pages.remove((x, y))
+        return data
+
+    def items(self) -> Iterator[Tuple[Tuple[int, int], Dict]]:
+        for x, y in self.pages:
+            yield (x, y), self.read(x, y)
@@ -0,0 +1,272 @@
+import heapq
+from typing import Dict, Set, Tuple, List, Optional, Union, Type, Callable, Iterable
+
+import pymunk
+from pymunk import Vec2d
+
+from src.entities.abstract.abstract import Entity
+
+EntityClasses = Union[Type[Entity], Tuple[Type[Entity], ...]]
+
+
+class SpatialHash:
+    """
+    Uniform grid of entities. Entity is stored in the cell of its center,
+    queries take its bounding circle into account
+    """
+
+    cell_size: float
+    cells: Dict[Tuple[int, int], Set[Entity]]
+    entity_cells: Dict[Entity, Tuple[int, int]]
+    radii: Dict[Entity, float]
+    max_radius: float
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.cells = dict()
+        self.entity_cells = dict()
+        self.radii = dict()
+        self.max_radius = 0
+
+    @staticmethod
+    def get_bounding_radius(entity: Entity) -> float:
+        shape = entity.shape
+        if isinstance(shape, pymunk.Circle):
+            return shape.radius + shape.offset.length
+        if isinstance(shape, pymunk.Poly):
+            return max(Vec2d(*v).length for v in shape.get_vertices()) + shape.radius
+        return 0
+
+    def get_cell(self, pos: Vec2d) -> Tuple[int, int]:
+        return int(pos.x // self.cell_size), int(pos.y // self.cell_size)
+
+    def __contains__(self, entity: Entity) -> bool:
+        return entity in self.entity_cells
+
+    def __len__(self) -> int:
+        return len(self.entity_cells)
+
+    def insert(self, entity: Entity) -> None:
+        if entity in self.entity_cells:
+            return
+        cell = self.get_cell(entity.position)
+        self.entity_cells[entity] = cell
+        self.cells.setdefault(cell, set()).add(entity)
+        radius = self.get_bounding_radius(entity)
+        self.radii[entity] = radius
+        self.max_radius = max(self.max_radius, radius)
+
+    def remove(self, entity: Entity) -> None:
+        cell = self.entity_cells.pop(entity, None)
+        if cell is None:
+            return
+        self.radii.pop(entity)
+        self.discard_from_cell(entity, cell)
+
+    def discard_from_cell(self, entity: Entity, cell: Tuple[int, int]) -> None:
+        bucket = self.cells[cell]
+        bucket.discard(entity)
+        if not bucket:
+            del self.cells[cell]
+
+    def update(self, entity: Entity) -> None:
+        old_cell = self.entity_cells.get(entity)
+        if old_cell is None:
+            return
+        cell = self.get_cell(entity.position)
+        if cell != old_cell:
+            self.discard_from_cell(entity, old_cell)
+            self.cells.setdefault(cell, set()).add(entity)
+            self.entity_cells[entity] = cell
+
+    def update_all(self) -> None:
+        cell_size = self.cell_size
+        moved = []
+        for entity, old_cell in self.entity_cells.items():
+            x, y = entity.position
+            cell = int(x // cell_size), int(y // cell_size)
+            if cell != old_cell:
+                moved.append((entity, old_cell, cell))
+        for entity, old_cell, cell in moved:
+            self.discard_from_cell(entity, old_cell)
+            self.cells.setdefault(cell, set()).add(entity)
+            self.entity_cells[entity] = cell
+
+    def candidates(self, pos: Vec2d, radius: float) -> Iterable[Entity]:
+        reach = radius + self.max_radius
+        px, py = pos
+        cell_size = self.cell_size
+        min_x, max_x = int((px - reach) // cell_size), int((px + reach) // cell_size)
+        min_y, max_y = int((py - reach) // cell_size), int((py + reach) // cell_size)
+        cells = self.cells
+        for cx in range(min_x, max_x + 1):
+            for cy in range(min_y, max_y + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+    def query(
+        self,
+        pos: Vec2d,
+        radius: float,
+        classes: Optional[EntityClasses] = None,
+        predicate: Optional[Callable[[Entity], bool]] = None,
+    ) -> List[Entity]:
+        return [
+            entity
+            for _, entity in self.query_with_distances(pos, radius, classes, predicate)
+        ]
+
+    def query_with_distances(
+        self,
+        pos: Vec2d,
+        radius: float,
+        classes: Optional[EntityClasses] = None,
+        predicate: Optional[Callable[[Entity], bool]] = None,
+    ) -> List[Tuple[float, Entity]]:
+        # Returns (squared distance between centers, entity) for entities
+        # whose bounding circle is not farther than radius from pos
+        px, py = pos
+        radii = self.radii
+        result = []
+        for entity in self.candidates(pos, radius):
+            if classes is not None and not isinstance(entity, classes):
+                continue
+            x, y = entity.position
+            dx, dy = x - px, y - py
+            squared_distance = dx * dx + dy * dy
+            limit = radius + radii[entity]
+            if squared_distance > limit * limit:
+                continue
+            if predicate is not None and not predicate(entity):
+                continue
+            result.append((squared_distance, entity))
+        return result
+
+    def nearest(
+        self,
+        pos: Vec2d,
+        radius: float,
+        count: int = 1,
+        classes: Optional[EntityClasses] = None,
+        predicate: Optional[Callable[[Entity], bool]] = None,
+    ) -> List[Entity]:
+        found = self.query_with_distances(pos, radius, classes, predicate)
+        return [
+            entity for _, entity in heapq.nsmallest(count, found, key=lambda i: i[0])
+        ]
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.entity_cells.clear()
+        self.radii.clear()
+        self.max_radius = 0
+
+
+class CategorizedSpatialHash:
+    """
+    Keeps a separate SpatialHash per category of entities,
+    so typed queries do not iterate over entities of other categories.
+    Categories must not intersect
+    """
+
+    categories: Tuple[Type[Entity], ...]
+    indexes: Dict[Optional[Type[Entity]], SpatialHash]
+    entity_indexes: Dict[Entity, SpatialHash]
+    classes_indexes: Dict[Optional[EntityClasses], List[SpatialHash]]
+
+    def __init__(self, cell_size: float, categories: Tuple[Type[Entity], ...]):
+        self.categories = categories
+        # None is a category for entities that do not belong to any of categories
+        self.indexes = {
+            category: SpatialHash(cell_size) for category in (*categories, None)
+        }
+        self.entity_indexes = dict()
+        self.classes_indexes = dict()
+
+    def get_category(self, entity: Entity) -> Optional[Type[Entity]]:
+        for category in self.categories:
+            if isinstance(entity, category):
+                return category
+        return None
+
+    def get_indexes(self, classes: Optional[EntityClasses]) -> List[SpatialHash]:
+        if classes not in self.classes_indexes:
+            self.classes_indexes[classes] = self.find_indexes(classes)
+        return self.classes_indexes[classes]
+
+    def find_indexes(self, classes: Optional[EntityClasses]) -> List[SpatialHash]:
+        if classes is None:
+            return list(self.indexes.values())
+        if not isinstance(classes, tuple):
+            classes = (classes,)
+        result = []
+        for category, index in self.indexes.items():
+            if category is None:
+                # Instances of classes inherited from some category are never there
+                suitable = any(not issubclass(cls, self.categories) for cls in classes)
+            else:
+                suitable = any(
+                    issubclass(category, cls) or issubclass(cls, category)
+                    for cls in classes
+                )
+            if suitable:
+                result.append(index)
+        return result
+
+    def __contains__(self, entity: Entity) -> bool:
+        return entity in self.entity_indexes
+
+    def __len__(self) -> int:
+        return len(self.entity_indexes)
+
+    def insert(self, entity: Entity) -> None:
+        if entity in self.entity_indexes:
+            return
+        index = self.indexes[self.get_category(entity)]
+        index.insert(entity)
+        self.entity_indexes[entity] = index
+
+    def remove(self, entity: Entity) -> None:
+        index = self.entity_indexes.pop(entity, None)
+        if index is not None:
+            index.remove(entity)
+
+    def update_all(self) -> None:
+        for index in self.indexes.values():
+            index.update_all()
+
+    def query(
+        self,
+        pos: Vec2d,
+        radius: float,
+        classes: Optional[EntityClasses] = None,
+        predicate: Optional[Callable[[Entity], bool]] = None,
+    ) -> List[Entity]:
+        result = []
+        for index in self.get_indexes(classes):
+            result.extend(index.query(pos, radius, classes, predicate))
+        return result
+
+    def nearest(
+        self,
+        pos: Vec2d,
+        radius: float,
+        count: int = 1,
+        classes: Optional[EntityClasses] = None,
+        predicate: Optional[Callable[[Entity], bool]] = None,
+    ) -> List[Entity]:
+        indexes = self.get_indexes(classes)
+        if len(indexes) == 1:
+            return indexes[0].nearest(pos, radius, count, classes, predicate)
+        found = []
+        for index in indexes:
+            found.extend(index.query_with_distances(pos, radius, classes, predicate))
+        return [
+            entity for _, entity in heapq.nsmallest(count, found, key=lambda i: i[0])
+        ]
+
+    def clear(self) -> None:
+        for index in self.indexes.values():
+            index.clear()
+        self.entity_indexes.clear()
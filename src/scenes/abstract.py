@@ -1,6 +1,7 @@
 from abc import abstractmethod, ABC
-from typing import Optional
+from typing import Optional, List
 
+from pygame import Rect
 from pygame_gui import UIManager
 
 from src.abstract import Updateable
@@ -22,9 +23,63 @@ class Scene(Updateable, ABC):
     def render(self, screen: Surface):
         self.ui_manager.draw_ui(screen)
 
+    def draw(self, screen: Surface, full: bool) -> Optional[List[Rect]]:
+        # Returns areas of the screen changed by the frame, None if all of it
+        screen.fill((0, 0, 0))
+        self.render(screen)
+        return None
+
     @abstractmethod
     def update(self, dt: float):
         self.ui_manager.update(dt)
 
     def process_event(self, e):
         self.ui_manager.process_events(e)
+
+
+class StaticBackgroundScene(Scene, ABC):
+    """
+    Scene where only GUI changes. Background is drawn once, and then only
+    areas of GUI elements are restored from it and drawn again
+    """
+
+    layer: Optional[Surface]
+    ui_rects: List[Rect]
+
+    def __init__(self, theme_path: Optional[str] = None):
+        super().__init__(theme_path)
+        self.layer = None
+        self.ui_rects = []
+
+    def render_background(self, screen: Surface):
+        # Black by default
+        pass
+
+    def render(self, screen: Surface):
+        self.render_background(screen)
+        super().render(screen)
+
+    def get_ui_rects(self) -> List[Rect]:
+        # Containers have empty images and draw nothing
+        return [
+            rect.copy()
+            for image, rect, *_ in self.ui_manager.get_sprite_group().visible
+            if image.get_width() and image.get_height()
+        ]
+
+    def draw(self, screen: Surface, full: bool) -> Optional[List[Rect]]:
+        if full or self.layer is None or self.layer.get_size() != screen.get_size():
+            screen.fill((0, 0, 0))
+            self.render_background(screen)
+            self.layer = screen.copy()
+            self.ui_manager.draw_ui(screen)
+            self.ui_rects = self.get_ui_rects()
+            return None
+        # Elements could move or disappear, so their old areas are restored too
+        ui_rects = self.get_ui_rects()
+        changed = self.ui_rects + ui_rects
+        for rect in changed:
+            screen.blit(self.layer, rect, rect)
+        self.ui_manager.draw_ui(screen)
+        self.ui_rects = ui_rects
+        return changed
@@ -3,7 +3,7 @@ from typing import Type, Optional
 
 from pygame import Surface
 
-from src.scenes.abstract import Scene
+from src.scenes.abstract import Scene, StaticBackgroundScene
 
 
 class Context(ABC):
@@ -47,3 +47,7 @@ class ContextScene(Scene, ABC):
     def __init__(self, context: Context, theme_path: Optional[str] = None):
         super().__init__(theme_path)
         self.context = context
+
+
+class StaticContextScene(ContextScene, StaticBackgroundScene, ABC):
+    pass
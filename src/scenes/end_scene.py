@@ -3,12 +3,12 @@ from pygame import Surface
 from pygame_gui.core import ObjectID
 from pygame_gui.elements import UILabel, UIButton
 
-from src.scenes.context import ContextScene, Context
+from src.scenes.context import StaticContextScene, Context
 from src.scenes.game.game_scene import GameScene
 from src.settings import END_GAME_SCENE_THEME_PATH
 
 
-class EndgameScene(ContextScene):
+class EndgameScene(StaticContextScene):
 
     TITLE_MARGIN_TOP = 100
     TITLE_SIZE = 600, 50
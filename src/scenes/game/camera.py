@@ -18,3 +18,11 @@ class Camera:
             assert isinstance(entity_or_x, int)
             assert isinstance(y, int)
             self.dv = Vec2d(entity_or_x, y)
+
+    def is_visible(self, pos: Vec2d, radius: float) -> bool:
+        x, y = pos + self.dv
+        return -radius <= x <= W + radius and -radius <= y <= H + radius
+
+    def is_rect_visible(self, x: float, y: float, w: float, h: float) -> bool:
+        x, y = Vec2d(x, y) + self.dv
+        return x <= W and y <= H and x + w >= 0 and y + h >= 0
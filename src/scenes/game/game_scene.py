@@ -1,4 +1,6 @@
-from typing import Optional
+import os
+from concurrent.futures import Future
+from typing import Optional, Iterable, Tuple, Any
 
 import pygame
 from pygame import Surface
@@ -6,7 +8,7 @@ from pymunk import Vec2d
 
 from src.abstract import Serializable
 from src.entities.get_entity import *
-from src.map.impls import map_from_dict
+from src.map.impls import map_from_dict, map_from_records, map_from_stream
 from src.map.impls.basic import BasicMap
 from .camera import Camera
 from .ui_overlapping import UIOverlapping
@@ -14,10 +16,15 @@ from ..context import ContextScene, Context
 from ...controls import Controls
 from ...entities.basic_entity.basic_spaceship import BasicSpaceship
 from ...entities.pilots.player.player import PlayerPilot
+from ...entities.pilots.scheduler import PerceptionScheduler
 from ...environment.abstract import set_environment
 from ...environment.impl import BasicEnvironment
 from ...map.abstract import AbstractMap
-from ...settings import GAME_SCENE_THEME_PATH
+from ...settings import GAME_SCENE_THEME_PATH, AUTOSAVE_INTERVAL, get_save_path
+from ...utils.chunked_file import ChunkedFile
+from ...utils.json_stream import Path
+from ...utils.saving import save_game_in_background
+from ...utils.timer import Timer
 
 
 class GameScene(Serializable, ContextScene):
@@ -45,6 +52,8 @@ class GameScene(Serializable, ContextScene):
         self.map = map_impl or BasicMap()
         environment = BasicEnvironment(self.map)
         set_environment(environment)
+        # Bots of a previous game must not perceive the new one
+        PerceptionScheduler().clear()
 
         # Camera
         self.camera = camera or Camera()
@@ -61,6 +70,8 @@ class GameScene(Serializable, ContextScene):
         # UI
         self.ui = UIOverlapping(target=self.player, manager=self.ui_manager)
 
+        self.autosave_timer = Timer(AUTOSAVE_INTERVAL, self.save)
+
     @property
     def pause(self) -> bool:
         return self._pause
@@ -80,6 +91,7 @@ class GameScene(Serializable, ContextScene):
         self.camera.look_at(self.player_entity)
         if not self.pause:
             self.map.update_at(self.player_entity.position, dt)
+            self.autosave_timer.update(dt)
         self.ui.update(dt)
 
         if Controls().is_key_just_up(pygame.K_p):
@@ -102,6 +114,78 @@ class GameScene(Serializable, ContextScene):
         self.map.add_entity(self.player_entity)
         return res
 
+    def to_records(self, only_dirty: bool) -> Dict[str, Dict]:
+        # Player is saved separately
+        records = self.map.to_records(only_dirty, exclude={self.player_entity})
+        records["game"] = {
+            "name": self.name,
+            "player": self.player_entity.to_dict(),
+            **super().to_dict(),
+        }
+        return records
+
+    def save(self, screenshot: Optional[Surface] = None) -> Future:
+        # Plain data snapshot is taken here, while encoding and writing
+        # are done in background. Only changed clusters are saved when
+        # the save file has the rest
+        only_changes = self.map.synced and os.path.exists(get_save_path(self.name))
+        records = self.to_records(only_dirty=only_changes)
+        self.map.mark_saved()
+        if screenshot is None:
+            screenshot = self.context.screenshot()
+        future = save_game_in_background(
+            self.name,
+            records,
+            self.player.score,
+            only_changes=only_changes,
+            screenshot=screenshot,
+        )
+        future.add_done_callback(self.on_saved)
+        return future
+
+    def on_saved(self, future: Future) -> None:
+        if future.exception() is not None:
+            print(f"Saving of {self.name} failed: {future.exception()!r}")
+            # Changes are lost, so the next save must have all the map
+            self.map.synced = False
+
+    @classmethod
+    def from_records(cls, records: ChunkedFile, context: Context):
+        data = records.read("game")
+        # Player is loaded before the map, since its bullets depend on it
+        entity = entity_from_dict(data["player"])
+        player = entity.pilot
+        return GameScene(
+            name=data["name"],
+            context=context,
+            player_entity=entity,
+            player=player,
+            map_impl=map_from_records(records),
+        )
+
+    @classmethod
+    def from_stream(cls, items: Iterable[Tuple[Path, Any]], context: Context):
+        data = dict()
+
+        def map_items():
+            for path, value in items:
+                if path[0] == "map":
+                    yield path[1:], value
+                else:
+                    data[path[0]] = value
+
+        # Legacy saves have the map first, its clusters are built while reading
+        map_impl = map_from_stream(map_items())
+        entity = entity_from_dict(data["player"])
+        player = entity.pilot
+        return GameScene(
+            name=data["name"],
+            context=context,
+            player_entity=entity,
+            player=player,
+            map_impl=map_impl,
+        )
+
     @classmethod
     def from_dict(cls, data: Dict):
         entity = entity_from_dict(data["player"])
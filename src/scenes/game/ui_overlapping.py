@@ -1,4 +1,4 @@
-from typing import Dict, Tuple, Union
+from typing import Dict, Tuple, Union, Optional
 
 import pygame
 from pygame_gui import UIManager
@@ -15,9 +15,9 @@ from src.settings import (
     RESOURCE_LINE_HEIGHT,
     SHOW_FPS,
     UPGRADES_BTN_HEIGHT,
-    STANDARD_FONT_PATH,
 )
 from src.settings import W, H, FPS_UPDATE_TIME
+from src.utils.font_manager import FontManager
 from src.utils.timer import Timer
 
 
@@ -26,7 +26,9 @@ class UIOverlapping(Updateable):
     manager: UIManager
     lines: Dict[ResourceType, UITextBox]
     current_toast: Tuple[str, float, Union[str, Tuple[int, int, int]]]
-    fps_font: pygame.font.Font
+    toast_image: Optional[pygame.Surface]
+    # Texts of resource lines, which are changed only when quantities change
+    line_texts: Dict[ResourceType, str]
     paused: bool
     last_fps: float
 
@@ -46,12 +48,10 @@ class UIOverlapping(Updateable):
 
         self.manager = manager
         self.current_toast = "", 0, self.TOAST_DEFAULT_COLOR
+        self.toast_image = None
 
         self.fps_timer = Timer(FPS_UPDATE_TIME, self.update_fps)
         self.current_fps = 0
-        self.fps_font = pygame.font.Font(STANDARD_FONT_PATH, 24)
-
-        self.paused_font = pygame.font.Font(STANDARD_FONT_PATH, 36)
         self.paused = False
 
         self.lines = {
@@ -67,6 +67,7 @@ class UIOverlapping(Updateable):
             )
             for i, rt in enumerate(ResourceType)
         }
+        self.line_texts = {rt: "0" for rt in ResourceType}
 
         # Upgrade system
         if isinstance(self.target.entity, UpgradeableSpaceshipMixin):
@@ -100,7 +101,7 @@ class UIOverlapping(Updateable):
         # Toast
         text, alpha, color = self.current_toast
         if alpha:
-            rendered = self.fps_font.render(text, False, color)
+            rendered = self.toast_image
             rendered.set_alpha(int(255 * alpha))
             screen.blit(
                 rendered,
@@ -112,21 +113,23 @@ class UIOverlapping(Updateable):
 
         # FPS
         if SHOW_FPS:
-            rendered = self.fps_font.render(
-                str(round(self.current_fps, 2)), False, "white"
-            )
+            fps = str(round(self.current_fps, 2))
+            rendered = FontManager().render(fps, 24, "white")
             screen.blit(rendered, (W - rendered.get_width() - 10, 10))
 
         # Paused
         if self.paused:
-            rendered = self.paused_font.render("Pause", False, "white")
+            rendered = FontManager().render("Pause", 36, "white")
             screen.blit(rendered, ((W - rendered.get_width()) // 2, 10))
 
     def update(self, dt: float):
         # Resources
         for i, rt in enumerate(ResourceType):
-            resource = self.target.resources[rt]
-            self.lines[rt].set_text(html_text=str(round(resource.quantity, 2)))
+            text = str(round(self.target.resources[rt].quantity, 2))
+            # Text boxes lay their text out again on every change
+            if text != self.line_texts[rt]:
+                self.lines[rt].set_text(html_text=text)
+                self.line_texts[rt] = text
 
         # Toast
         text, alpha, color = self.current_toast
@@ -148,3 +151,5 @@ class UIOverlapping(Updateable):
         self, text: str, color: Union[str, Tuple[int, int, int]] = TOAST_DEFAULT_COLOR
     ):
         self.current_toast = text, 1, color
+        # Toast is faded by alpha of its own surface, so it is not shared
+        self.toast_image = FontManager().get_font(24).render(text, False, color)
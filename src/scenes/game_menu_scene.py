@@ -2,13 +2,13 @@ import pygame.draw
 from pygame import Surface
 from pygame_gui.elements import UIPanel, UIButton, UILabel
 
-from .context import ContextScene, Context
+from .context import StaticContextScene, Context
 from .game.game_scene import GameScene
 from ..controls import Controls
-from ..settings import GAME_MENU_SCENE_THEME_PATH, save_game
+from ..settings import GAME_MENU_SCENE_THEME_PATH
 
 
-class GameMenuScene(ContextScene):
+class GameMenuScene(StaticContextScene):
     def __init__(self, context: Context, game_scene: GameScene):
         super().__init__(context, theme_path=GAME_MENU_SCENE_THEME_PATH)
         self.game_scene = game_scene
@@ -55,14 +55,10 @@ class GameMenuScene(ContextScene):
             anchors={"top_target": self.save_btn, "centerx": "centerx"},
         )
 
-    def render(self, screen: Surface):
-        # Background
+    def render_background(self, screen: Surface):
         screen.blit(self.background, (0, 0))
         screen.blit(self.blackout, (0, 0))
 
-        # GUI
-        super().render(screen)
-
     def update(self, dt):
         super().update(dt)
         if (
@@ -71,10 +67,6 @@ class GameMenuScene(ContextScene):
         ):
             self.context.set_scene(self.game_scene)
         if self.save_btn.check_pressed():
-            save_game(
-                self.game_scene.name,
-                self.game_scene.serialize(),
-                self.game_scene.player.score,
-            )
+            self.game_scene.save(self.background)
         if self.exit_btn.check_pressed():
             self.context.launch_main_menu_scene()
@@ -14,10 +14,12 @@ from pygame_gui.elements import (
 )
 
 from src.settings import W, H, delete_game
-from .context import ContextScene, Context
+from .context import StaticContextScene, Context
 from ..controls import Controls
-from ..settings import MENU_SCENE_THEME_PATH, get_saves
+from ..settings import MENU_SCENE_THEME_PATH, THUMBNAIL_SIZE, get_saves
+from ..settings import get_save_thumbnail
 from ..utils.image_manager import ImageManager
+from ..utils.saving import wait_for_saves
 from ..utils.signal import SignalFieldMixin, Signal
 
 
@@ -78,7 +80,7 @@ class GetSaveNameDialog(UIWindow, SignalFieldMixin):
         return self.input.get_text()
 
 
-class MainMenuScene(ContextScene):
+class MainMenuScene(StaticContextScene):
 
     LEFT_PADDING = 70
     TOP_PADDING = 150
@@ -88,6 +90,7 @@ class MainMenuScene(ContextScene):
     GAMES_MARGIN_LEFT = 70
     GAMES_WIDTH = 700
     GAMES_HEIGHT = 370
+    THUMBNAIL_MARGIN_LEFT = 20
 
     def __init__(self, context: Context):
         super().__init__(context, theme_path=MENU_SCENE_THEME_PATH)
@@ -164,7 +167,7 @@ class MainMenuScene(ContextScene):
             relative_rect=pygame.Rect(
                 self.GAMES_MARGIN_LEFT,
                 self.MENU_ITEM_SPACING,
-                self.GAMES_WIDTH,
+                self.GAMES_WIDTH - THUMBNAIL_SIZE[0] - self.THUMBNAIL_MARGIN_LEFT,
                 self.GAMES_HEIGHT - self.games_title.get_starting_height(),
             ),
             manager=self.ui_manager,
@@ -172,10 +175,21 @@ class MainMenuScene(ContextScene):
             object_id=ObjectID(class_id="@games_list", object_id="#games_list"),
             anchors={"top_target": self.games_title, "left_target": self.title},
         )
+        # Screenshot of the selected save
+        self.thumbnail = UIImage(
+            relative_rect=pygame.Rect(
+                self.THUMBNAIL_MARGIN_LEFT, self.MENU_ITEM_SPACING, *THUMBNAIL_SIZE
+            ),
+            image_surface=Surface(THUMBNAIL_SIZE),
+            manager=self.ui_manager,
+            anchors={"top_target": self.games_title, "left_target": self.saves_list},
+        )
         self.update_saves()
         self.deletion_dialog = None
 
     def update_saves(self):
+        # Saves list and files are changed by the saving thread
+        wait_for_saves()
         self.saves = dict()
         for save in get_saves():
             save_name = save["name"]
@@ -183,6 +197,18 @@ class MainMenuScene(ContextScene):
             list_name = f"{save_name}. Score: {round(float(score), 2)}"
             self.saves[list_name] = save_name
         self.saves_list.set_item_list([i for i in self.saves])
+        self.update_thumbnail()
+
+    def update_thumbnail(self):
+        selected = self.get_selected()
+        thumbnail = None
+        if selected is not None:
+            thumbnail = get_save_thumbnail(self.saves[selected])
+        if thumbnail is None:
+            self.thumbnail.hide()
+        else:
+            self.thumbnail.set_image(thumbnail)
+            self.thumbnail.show()
 
     DIALOG_WINDOW_SIZE = 250, 100
 
@@ -223,9 +249,19 @@ class MainMenuScene(ContextScene):
             and e.ui_element == self.saves_list
         ):
             self.load_game()
+        if (
+            e.type
+            in (
+                pygame_gui.UI_SELECTION_LIST_NEW_SELECTION,
+                pygame_gui.UI_SELECTION_LIST_DROPPED_SELECTION,
+            )
+            and e.ui_element == self.saves_list
+        ):
+            self.update_thumbnail()
 
     def delete_save(self):
         selected = self.get_selected()
+        wait_for_saves()
         delete_game(self.saves[selected])
         self.update_saves()
 
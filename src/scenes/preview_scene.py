@@ -1,13 +1,22 @@
 import pygame
 import pygame_gui
+from typing import Optional
+
 from pygame import Surface
 from pygame_gui.elements import UITextBox
 
 from .context import ContextScene, Context
 from ..settings import PREVIEW_SCENE_THEME_PATH, W, H
+from ..utils.asset_preloader import AssetPreloader, get_manifest_tasks
 
 
 class PreviewScene(ContextScene):
+
+    preloader: Optional[AssetPreloader]
+    progress_bar_rect = pygame.Rect(W / 2 - 150, H - 60, 300, 4)
+    progress_bar_color = "#c5cbd8"
+    progress_bar_bg_color = "#25292e"
+
     def __init__(self, context: Context):
         super().__init__(context, theme_path=PREVIEW_SCENE_THEME_PATH)
         self.title = UITextBox(
@@ -18,13 +27,26 @@ class PreviewScene(ContextScene):
         )
         self.title.set_active_effect(pygame_gui.TEXT_EFFECT_TYPING_APPEAR)
         self.animation_passed = False
+        # Assets are converted to the display format, so they are loaded
+        # from the first update, when the display is set
+        self.preloader = None
 
     def render(self, screen: Surface):
         super().render(screen)
+        if self.preloader is not None:
+            rect = self.progress_bar_rect
+            pygame.draw.rect(screen, self.progress_bar_bg_color, rect)
+            filled = rect.w * self.preloader.progress
+            pygame.draw.rect(
+                screen, self.progress_bar_color, (*rect.topleft, filled, rect.h)
+            )
 
     def update(self, dt):
         super().update(dt)
-        if self.animation_passed:
+        if self.preloader is None:
+            self.preloader = AssetPreloader(get_manifest_tasks())
+        self.preloader.update()
+        if self.animation_passed and self.preloader.is_done:
             self.context.launch_main_menu_scene()
 
     def process_event(self, e):
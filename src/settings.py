@@ -1,17 +1,23 @@
-import csv
+import io
 import os
 import json
-from typing import Dict, List
+from typing import Dict, List, Optional, Iterator, Tuple, Any
 
 import pygame.image
+import pygame.transform
 from pygame import Surface
 
+from src.utils.chunked_file import ChunkedFile
+from src.utils.json_stream import JsonStream, Path
+from src.utils.save_index import SaveIndex
+
 SRC_DIR = os.path.dirname(__file__)
 CONFIGS_DIR = os.path.join(SRC_DIR, "configs")
 DATA_DIR = os.path.join(SRC_DIR, "data")
 IMAGES_DIR = os.path.join(DATA_DIR, "images")
 SAVES_DIR = os.path.join(DATA_DIR, "saves")
 SOUNDS_DIR = os.path.join(DATA_DIR, "sounds")
+GIF_CACHE_DIR = os.path.join(DATA_DIR, "cache")
 THEMES_DIR = os.path.join(CONFIGS_DIR, "themes")
 GAME_SCENE_THEME_PATH = os.path.join(THEMES_DIR, "game_scene_ui_theme.json")
 GAME_MENU_SCENE_THEME_PATH = os.path.join(THEMES_DIR, "game_menu_scene_ui_theme.json")
@@ -32,6 +38,13 @@ def get_spaceship_general_config(name: str) -> Dict:
     return get_json(config_path)
 
 
+def get_spaceship_general_configs() -> List[Dict]:
+    directory = os.path.join(CONFIGS_DIR, "spaceships/general")
+    return [
+        get_spaceship_general_config(name) for name in sorted(os.listdir(directory))
+    ]
+
+
 def get_entity_start_config(name: str) -> Dict:
     entity_start_configs_directory = os.path.join(
         CONFIGS_DIR, "spaceships/start_entities"
@@ -52,6 +65,15 @@ def get_bullet_configs(name: str) -> List[Dict]:
     return get_json(config_path)
 
 
+def get_all_bullet_configs() -> List[Dict]:
+    directory = os.path.join(CONFIGS_DIR, "gadgets/weapon/bullets")
+    return [
+        data
+        for name in sorted(os.listdir(directory))
+        for data in get_bullet_configs(name)
+    ]
+
+
 def get_drills_configs() -> List[Dict]:
     config_path = os.path.join(CONFIGS_DIR, "gadgets/drills.json")
     return get_json(config_path)
@@ -71,45 +93,97 @@ def get_spaceship_upgrade_config(name: str) -> Dict:
     return get_json(os.path.join(CONFIGS_DIR, f"spaceships/upgrades/{name}.json"))
 
 
-def get_saves():
-    result = []
-    with open(os.path.join(SAVES_DIR, "saves.csv"), encoding="utf-8") as r:
-        reader = csv.DictReader(r, delimiter=";")
-        for d in reader:
-            result.append(d)
-    return result
+save_indexes: Dict[str, SaveIndex] = dict()
+
+
+def get_save_index() -> SaveIndex:
+    if SAVES_DIR not in save_indexes:
+        save_indexes[SAVES_DIR] = SaveIndex(
+            os.path.join(SAVES_DIR, "saves.db"), os.path.join(SAVES_DIR, "saves.csv")
+        )
+    return save_indexes[SAVES_DIR]
+
+
+def get_saves() -> List[Dict]:
+    return get_save_index().list()
+
+
+def get_save_thumbnail(name: str) -> Optional[Surface]:
+    thumbnail = get_save_index().get_thumbnail(name)
+    if thumbnail is None:
+        return None
+    return pygame.image.load(io.BytesIO(thumbnail), "thumbnail.png")
+
+
+def get_save_path(name: str) -> str:
+    return os.path.join(SAVES_DIR, f"{name}.save")
+
+
+# Saves of old versions are single json files
+def get_legacy_save_path(name: str) -> str:
+    return os.path.join(SAVES_DIR, f"{name}.json")
 
 
 def delete_game(name: str):
-    os.remove(os.path.join(SAVES_DIR, f"{name}.json"))
-    prev_data = [i for i in get_saves() if i["name"] != name]
-    with open(
-        os.path.join(SAVES_DIR, "saves.csv"), newline="", mode="w", encoding="utf-8"
-    ) as w:
-        writer = csv.DictWriter(w, fieldnames=["name", "score"], delimiter=";")
-        writer.writeheader()
-        writer.writerows(prev_data)
-
-
-def save_game(name: str, data: str, score: float) -> None:
-    with open(os.path.join(SAVES_DIR, f"{name}.json"), mode="w", encoding="utf-8") as w:
-        w.write(data)
-    prev_data = [i for i in get_saves() if i["name"] != name]
-    with open(
-        os.path.join(SAVES_DIR, "saves.csv"), newline="", mode="w", encoding="utf-8"
-    ) as w:
-        writer = csv.DictWriter(w, fieldnames=["name", "score"], delimiter=";")
-        writer.writeheader()
-        writer.writerows(prev_data)
-        writer.writerow({"name": name, "score": score})
+    for path in (get_save_path(name), get_legacy_save_path(name)):
+        if os.path.exists(path):
+            os.remove(path)
+    get_save_index().delete(name)
+
+
+def save_game(
+    name: str,
+    records: Dict[str, Dict],
+    score: float,
+    only_changes: bool = False,
+    screenshot: Optional[Surface] = None,
+) -> None:
+    save = ChunkedFile(get_save_path(name))
+    if only_changes:
+        save.write(records)
+    else:
+        save.rewrite(records)
+    if os.path.exists(get_legacy_save_path(name)):
+        os.remove(get_legacy_save_path(name))
+    thumbnail = None
+    if screenshot is not None:
+        with io.BytesIO() as w:
+            pygame.image.save(
+                pygame.transform.smoothscale(screenshot, THUMBNAIL_SIZE),
+                w,
+                "thumbnail.png",
+            )
+            thumbnail = w.getvalue()
+    get_save_index().upsert(
+        name, score, os.path.getsize(get_save_path(name)), thumbnail
+    )
 
 
 def game_exists(name: str) -> bool:
-    return os.path.exists(os.path.join(SAVES_DIR, f"{name}.json"))
+    return os.path.exists(get_save_path(name)) or os.path.exists(
+        get_legacy_save_path(name)
+    )
+
+
+def open_game(name: str) -> Optional[ChunkedFile]:
+    if os.path.exists(get_save_path(name)):
+        return ChunkedFile(get_save_path(name))
+    return None
 
 
-def load_game(name: str) -> Dict:
-    return get_json(os.path.join(SAVES_DIR, f"{name}.json"))
+LEGACY_CLUSTERS_PATH = ("map", "clusters", "lines")
+
+
+def is_legacy_save_split(path: Path) -> bool:
+    # Objects down to lines of clusters, so every cluster is a separate value
+    return len(path) <= len(LEGACY_CLUSTERS_PATH) + 1 and all(
+        a == b for a, b in zip(path, LEGACY_CLUSTERS_PATH)
+    )
+
+
+def stream_game(name: str) -> Iterator[Tuple[Path, Any]]:
+    with open(get_legacy_save_path(name), encoding="utf-8") as r:
+        yield from JsonStream(r).items(is_legacy_save_split)
 
 
 def get_path_to_image(name: str) -> str:
@@ -138,6 +212,38 @@ HEALTH_BAR_FONT_COLOR = general_config["health_bar_font_color"]
 RESOURCE_LINE_HEIGHT = general_config["resource_line_height"]
 UPGRADES_BTN_HEIGHT = general_config["upgrades_btn_height"]
 
+# RENDER
+RENDER = general_config["render"]
+# Sprites are rotated by angles rounded to this step in degrees
+ROTATION_STEP = RENDER["rotation_step"]
+ROTATION_CACHE_SIZE = RENDER["rotation_cache_size_mb"] * 1024 * 1024
+# Surfaces drawn once by views, such as asteroids
+RENDERED_CACHE_SIZE = RENDER["rendered_cache_size_mb"] * 1024 * 1024
+# Count of rendered texts kept for reuse
+TEXT_CACHE_SIZE = RENDER["text_cache_size"]
+# Explosion sizes are rounded up to this step, and this many sizes are kept
+EXPLOSION_SIZE_STEP = RENDER["explosion_size_step"]
+EXPLOSION_SIZES_COUNT = RENDER["explosion_sizes_count"]
+# Drill beam lengths are rounded to this step, and this many lengths are kept
+BEAM_LENGTH_STEP = RENDER["beam_length_step"]
+BEAMS_COUNT = RENDER["beams_count"]
+
+LAZY_GIF_MIN_SIZE = RENDER["lazy_gif_min_size_kb"] * 1024
+GIF_WINDOW = RENDER["gif_window"]
+GIF_CACHE = RENDER["gif_cache"]
+# Clusters farther than this from the screen are not rendered
+CULLING_MARGIN = RENDER["culling_margin"]
+# Space around entity views for their health bars
+RENDER_MARGIN = RENDER["entity_render_margin"]
+
+# PRELOADING
+PRELOADING = general_config["preloading"]
+# Assets loaded while the preview plays, so the game does not stall on them
+ASSETS_MANIFEST = get_json(os.path.join(CONFIGS_DIR, "assets.json"))
+PRELOAD_IN_BACKGROUND = PRELOADING["in_background"]
+# Time of a frame spent on assets when they are not loaded in background
+PRELOAD_FRAME_BUDGET = PRELOADING["frame_budget_ms"] / 1000
+
 # DEBUG
 debug_data = general_config["debug"]
 DEBUG = debug_data["active"]
@@ -145,11 +251,30 @@ SHOW_VELOCITY_VECTOR = DEBUG and debug_data["show_velocity_vector"]
 SHOW_CLUSTERS_BORDERS = DEBUG and debug_data["show_clusters_borders"]
 SHOW_PLAYER_COLLISION_POLY = DEBUG and debug_data["show_player_collision_poly"]
 SAVE_GAME = False
+AUTOSAVE_INTERVAL = general_config["autosave_interval"]
+THUMBNAIL_SIZE = tuple(general_config["save_thumbnail_size"])
 LOG_GENERATING = False
 
 # MAP
 MAP = general_config["map"]
 VISION_DISTANCE = MAP["vision_distance"]
+# Clusters of saves are created only when they are accessed
+LAZY_LOADING = MAP["lazy_loading"]
+SPATIAL_HASH_CELL_SIZE = MAP["spatial_hash_cell_size"]
+# Map level of detail
+LOD = MAP["lod"]
+LOD_FULL_DISTANCE = LOD["full_distance"]
+LOD_REDUCED_DISTANCE = LOD["reduced_distance"]
+LOD_REDUCED_INTERVAL = LOD["reduced_interval"]
+LOD_DRIFT_INTERVAL = LOD["drift_interval"]
+# Map generation in background, frame budget is in seconds
+MAP_GENERATION = MAP["generation"]
+MAP_GENERATION_WORKERS = MAP_GENERATION["workers"]
+MAP_GENERATION_FRAME_BUDGET = MAP_GENERATION["frame_budget"]
+# Clusters farther than distance or over max_clusters are paged to disk
+PAGING = MAP["paging"]
+PAGING_DISTANCE = PAGING["distance"]
+PAGING_MAX_CLUSTERS = PAGING["max_clusters"]
 # Map Cluster
 CLUSTER = MAP["cluster"]
 CLUSTER_WIDTH = CLUSTER["width"]
@@ -158,3 +283,7 @@ CLUSTER_SIZE = CLUSTER_WIDTH, CLUSTER_HEIGHT
 
 # BOTS
 SPACESHIP_BOT_VISION_RADIUS = general_config["spaceship_bot_vision_radius"]
+SPACESHIP_BOT_PERCEPTION_RATE = general_config["spaceship_bot_perception_rate"]
+SPACESHIP_BOT_PERCEPTIONS_PER_TICK = general_config[
+    "spaceship_bot_perceptions_per_tick"
+]
@@ -0,0 +1,98 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import partial
+from typing import Callable, Dict, List, Optional, Set
+
+from src.settings import ASSETS_MANIFEST, PRELOAD_IN_BACKGROUND, PRELOAD_FRAME_BUDGET
+from src.settings import get_all_bullet_configs, get_spaceship_general_configs
+from src.utils.font_manager import FontManager
+from src.utils.image_manager import ImageManager
+from src.utils.polygon_size import get_polygon_size
+from src.utils.sound_manager import SoundManager
+
+Task = Callable[[], object]
+
+
+def get_explosion_radii() -> Set[float]:
+    # Same radii as views explode with: bullets by their explosion radius
+    # and radius, spaceships by their size
+    radii = {
+        config["explosion_radius"] + config["radius"]
+        for config in get_all_bullet_configs()
+    }
+    radii.update(
+        max(get_polygon_size(config["vertices"]))
+        for config in get_spaceship_general_configs()
+    )
+    return radii
+
+
+def get_manifest_tasks(manifest: Dict = ASSETS_MANIFEST) -> List[Task]:
+    # Assets are loaded by the same calls, which load them at first use
+    image_manager = ImageManager()
+    tasks = [partial(image_manager.get_pic, name) for name in manifest["images"]]
+    # First frame of a lazy GIF builds its raw frames cache
+    tasks += [
+        partial(lambda name: image_manager.get_gif(name)[0], name)
+        for name in manifest["gifs"]
+    ]
+    if manifest["explosions"]:
+        tasks += [
+            partial(image_manager.get_explosion_frames, radius)
+            for radius in get_explosion_radii()
+        ]
+    font_manager = FontManager()
+    tasks += [partial(font_manager.get_font, size) for size in manifest["font_sizes"]]
+    if manifest["sounds"]:
+        tasks.append(SoundManager)
+    return tasks
+
+
+class AssetPreloader:
+    """
+    Loads assets before they are used. Tasks are run one by one by a worker
+    thread, or on the main thread by updates, each within a time budget
+    """
+
+    tasks: List[Task]
+    done_count: int
+    executor: Optional[ThreadPoolExecutor]
+    futures: List[Future]
+
+    def __init__(self, tasks: List[Task], in_background: bool = PRELOAD_IN_BACKGROUND):
+        self.tasks = tasks
+        self.done_count = 0
+        self.executor = None
+        self.futures = []
+        if in_background:
+            self.executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="preloading"
+            )
+            self.futures = [self.executor.submit(task) for task in tasks]
+            # Worker exits when the tasks are done
+            self.executor.shutdown(wait=False)
+
+    @property
+    def progress(self) -> float:
+        if not self.tasks:
+            return 1
+        return self.done_count / len(self.tasks)
+
+    @property
+    def is_done(self) -> bool:
+        return self.done_count == len(self.tasks)
+
+    def update(self, budget: float = PRELOAD_FRAME_BUDGET) -> None:
+        if self.executor is not None:
+            while self.done_count < len(self.futures):
+                future = self.futures[self.done_count]
+                if not future.done():
+                    return
+                # Errors of assets are raised as if they were loaded here
+                future.result()
+                self.done_count += 1
+            return
+        end = time.perf_counter() + budget
+        while not self.is_done and time.perf_counter() < end:
+            self.tasks[self.done_count]()
+            self.done_count += 1
@@ -0,0 +1,140 @@
+import json
+import os
+import struct
+import zlib
+from typing import Dict, Tuple, List, Iterable, Iterator
+
+# Magic, version, index offset and index size
+HEADER = struct.Struct("<8sIQQ")
+MAGIC = b"SPCHUNKS"
+VERSION = 1
+# File is compacted when it is this times bigger than its live records
+COMPACTION_RATIO = 2
+
+
+class InvalidChunkedFile(Exception):
+    pass
+
+
+def encode(data: Dict) -> bytes:
+    return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+
+def decode(chunk: bytes) -> Dict:
+    return json.loads(zlib.decompress(chunk).decode("utf-8"))
+
+
+class ChunkedFile:
+    """
+    File of compressed JSON records with an index of their offsets.
+    Changed records and the new index are appended, and the header is
+    rewritten last, so an interrupted write leaves the previous state readable
+    """
+
+    path: str
+    index: Dict[str, Tuple[int, int]]
+    size: int
+
+    def __init__(self, path: str):
+        self.path = path
+        self.index = dict()
+        self.size = HEADER.size
+        if os.path.exists(path):
+            self.read_index()
+
+    def read_index(self) -> None:
+        with open(self.path, "rb") as r:
+            header = r.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise InvalidChunkedFile(self.path)
+            magic, version, offset, size = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise InvalidChunkedFile(self.path)
+            r.seek(offset)
+            self.index = {key: tuple(val) for key, val in decode(r.read(size)).items()}
+        self.size = offset + size
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def keys(self) -> List[str]:
+        return list(self.index)
+
+    def read(self, key: str) -> Dict:
+        offset, size = self.index[key]
+        with open(self.path, "rb") as r:
+            r.seek(offset)
+            return decode(r.read(size))
+
+    def read_many(self, keys: Iterable[str]) -> Iterator[Tuple[str, Dict]]:
+        with open(self.path, "rb") as r:
+            for key in keys:
+                offset, size = self.index[key]
+                r.seek(offset)
+                yield key, decode(r.read(size))
+
+    def read_raw_many(self, keys: Iterable[str]) -> Iterator[Tuple[str, bytes]]:
+        # Compressed records, which can be decoded later
+        with open(self.path, "rb") as r:
+            for key in keys:
+                offset, size = self.index[key]
+                r.seek(offset)
+                yield key, r.read(size)
+
+    def write(self, records: Dict[str, Dict]) -> None:
+        # Appends records, replacing the ones with the same keys
+        if not os.path.exists(self.path):
+            self.rewrite(records)
+            return
+        with open(self.path, "r+b") as w:
+            # Anything after the last index is left from an interrupted write
+            w.seek(self.size)
+            for key, data in records.items():
+                chunk = encode(data)
+                self.index[key] = (w.tell(), len(chunk))
+                w.write(chunk)
+            self.write_index_and_header(w)
+        if self.size > COMPACTION_RATIO * self.get_live_size():
+            self.compact()
+
+    def write_index_and_header(self, w) -> None:
+        offset = w.tell()
+        chunk = encode(self.index)
+        w.write(chunk)
+        w.truncate()
+        w.flush()
+        os.fsync(w.fileno())
+        w.seek(0)
+        w.write(HEADER.pack(MAGIC, VERSION, offset, len(chunk)))
+        w.flush()
+        os.fsync(w.fileno())
+        self.size = offset + len(chunk)
+
+    def get_live_size(self) -> int:
+        return HEADER.size + sum(size for _, size in self.index.values())
+
+    def rewrite(self, records: Dict[str, Dict]) -> None:
+        self.replace_with({key: encode(data) for key, data in records.items()})
+
+    def compact(self) -> None:
+        with open(self.path, "rb") as r:
+            chunks = dict()
+            for key, (offset, size) in self.index.items():
+                r.seek(offset)
+                chunks[key] = r.read(size)
+        self.replace_with(chunks)
+
+    def replace_with(self, chunks: Dict[str, bytes]) -> None:
+        # New file is written aside and atomically replaces the old one
+        tmp_path = f"{self.path}.tmp"
+        self.index = dict()
+        with open(tmp_path, "wb") as w:
+            w.write(bytes(HEADER.size))
+            for key, chunk in chunks.items():
+                self.index[key] = (w.tell(), len(chunk))
+                w.write(chunk)
+            self.write_index_and_header(w)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,35 @@
+from typing import Dict, Tuple, Union
+
+import pygame.font
+from pygame import Surface
+
+from src.settings import STANDARD_FONT_PATH, TEXT_CACHE_SIZE
+from src.utils.decorators import singleton
+from src.utils.lru_cache import LRUCache
+
+Color = Union[str, Tuple[int, int, int]]
+
+
+@singleton
+class FontManager:
+
+    fonts: Dict[Tuple[str, int], pygame.font.Font]
+    texts: LRUCache[Surface]
+
+    def __init__(self):
+        self.fonts = dict()
+        self.texts = LRUCache(TEXT_CACHE_SIZE)
+
+    def get_font(self, size: int, path: str = STANDARD_FONT_PATH) -> pygame.font.Font:
+        if (path, size) not in self.fonts:
+            self.fonts[path, size] = pygame.font.Font(path, size)
+        return self.fonts[path, size]
+
+    def render(
+        self, text: str, size: int, color: Color, path: str = STANDARD_FONT_PATH
+    ) -> Surface:
+        # Texts like health values repeat a lot, so their surfaces are shared
+        return self.texts.get_or_create(
+            (text, size, color, path),
+            lambda: self.get_font(size, path).render(text, False, color),
+        )
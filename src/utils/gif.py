@@ -1,8 +1,14 @@
-from typing import List
+import mmap
+import os
+import struct
+from typing import List, Callable, Sequence, Optional
 
 import pygame
 from PIL import ImageSequence, Image
-from src.settings import get_path_to_image
+from pygame import Surface
+
+from src.settings import get_path_to_image, GIF_CACHE_DIR, GIF_WINDOW
+from src.utils.lru_cache import LRUCache
 
 
 def pil_image_to_surface(pil_image) -> pygame.Surface:
@@ -20,3 +26,135 @@ def load_gif(filename) -> List[pygame.Surface]:
     else:
         frames.append(pil_image_to_surface(pil_image))
     return frames
+
+
+class LazyFrames(Sequence[Surface]):
+    """
+    Frames which are created on demand. Only a window of recently used ones
+    is kept, so animations played in order create one frame at a time
+    """
+
+    def __init__(
+        self, count: int, create: Callable[[int], Surface], window: int = GIF_WINDOW
+    ):
+        self.count = count
+        self.create = create
+        self.frames = LRUCache(window)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return self.frames.get_or_create(index, lambda: self.create(index))
+
+    def map(
+        self, transform: Callable[[Surface], Surface], window: Optional[int] = None
+    ) -> "LazyFrames":
+        if window is None:
+            window = self.frames.max_weight
+        return LazyFrames(self.count, lambda i: transform(self[i]), window)
+
+
+class GifDecoder:
+    # Decodes frames with PIL, which is fast when they are read in order
+
+    def __init__(self, path: str):
+        self.image = Image.open(path)
+        self.count = getattr(self.image, "n_frames", 1)
+        self.size = self.image.size
+
+    def get_rgba(self, index: int) -> bytes:
+        self.image.seek(index)
+        return self.image.convert("RGBA").tobytes()
+
+    def decode(self, index: int) -> Surface:
+        return pygame.image.frombuffer(self.get_rgba(index), self.size, "RGBA")
+
+
+class RawFramesCache:
+    """
+    Decoded RGBA frames of a GIF in a memory-mapped file, so later starts
+    do not decode the GIF and only pages of used frames are read
+    """
+
+    # Magic, version, source size, source modification time,
+    # frame width, frame height and frames count
+    HEADER = struct.Struct("<4sIQQIII")
+    MAGIC = b"GIFR"
+    VERSION = 1
+
+    def __init__(self, path: str):
+        with open(path, "rb") as r:
+            self.mmap = mmap.mmap(r.fileno(), 0, access=mmap.ACCESS_READ)
+        _, _, _, _, w, h, self.count = self.HEADER.unpack_from(self.mmap)
+        self.size = w, h
+
+    @classmethod
+    def get_source_stamp(cls, source_path: str):
+        stat = os.stat(source_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    @classmethod
+    def is_valid(cls, path: str, source_path: str) -> bool:
+        if not os.path.exists(path):
+            return False
+        with open(path, "rb") as r:
+            header = r.read(cls.HEADER.size)
+        if len(header) != cls.HEADER.size:
+            return False
+        magic, version, size, mtime, *_ = cls.HEADER.unpack(header)
+        return (magic, version, (size, mtime)) == (
+            cls.MAGIC,
+            cls.VERSION,
+            cls.get_source_stamp(source_path),
+        )
+
+    @classmethod
+    def build(cls, path: str, source_path: str) -> None:
+        # Frames are written one by one, and the file replaces the old one
+        # only when it is complete
+        decoder = GifDecoder(source_path)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as w:
+            w.write(
+                cls.HEADER.pack(
+                    cls.MAGIC,
+                    cls.VERSION,
+                    *cls.get_source_stamp(source_path),
+                    *decoder.size,
+                    decoder.count,
+                )
+            )
+            for i in range(decoder.count):
+                w.write(decoder.get_rgba(i))
+        os.replace(tmp_path, path)
+
+    def decode(self, index: int) -> Surface:
+        w, h = self.size
+        offset = self.HEADER.size + index * w * h * 4
+        data = memoryview(self.mmap)[offset : offset + w * h * 4]
+        return pygame.image.frombuffer(data, self.size, "RGBA")
+
+
+def open_gif(filename: str, use_cache: bool = True) -> LazyFrames:
+    source_path = get_path_to_image(filename)
+    decoder = None
+    if use_cache:
+        path = os.path.join(GIF_CACHE_DIR, f"{filename}.raw")
+        try:
+            if not RawFramesCache.is_valid(path, source_path):
+                os.makedirs(GIF_CACHE_DIR, exist_ok=True)
+                RawFramesCache.build(path, source_path)
+            decoder = RawFramesCache(path)
+        except OSError:
+            # Cache is optional, frames are decoded from the GIF without it
+            decoder = None
+    if decoder is None:
+        decoder = GifDecoder(source_path)
+    return LazyFrames(decoder.count, lambda i: decoder.decode(i).convert_alpha())
@@ -1,19 +1,43 @@
-from typing import List, Tuple, Dict, Optional, Union
+import math
+import os
+from typing import Tuple, Dict, Optional, Union, Hashable, Callable, Sequence
 
 import pygame.transform
 from pygame import Surface
 
-from src.settings import load_image
+from src.settings import load_image, ROTATION_STEP, ROTATION_CACHE_SIZE
+from src.settings import RENDERED_CACHE_SIZE, EXPLOSION_SIZE_STEP, EXPLOSION_SIZES_COUNT
+from src.settings import BEAM_LENGTH_STEP, BEAMS_COUNT, LAZY_GIF_MIN_SIZE, GIF_CACHE
+from src.settings import get_path_to_image
 from src.utils.decorators import singleton
-from src.utils.gif import load_gif
+from src.utils.gif import load_gif, open_gif, LazyFrames
+from src.utils.lru_cache import LRUCache
+
+
+def get_surface_size(surface: Surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def map_frames(
+    frames: Sequence[Surface],
+    transform: Callable[[Surface], Surface],
+    window: Optional[int] = None,
+) -> Sequence[Surface]:
+    # Frames of lazy GIFs are transformed on demand too
+    if isinstance(frames, LazyFrames):
+        return frames.map(transform, window)
+    return tuple(transform(frame) for frame in frames)
 
 
 @singleton
 class ImageManager:
 
     pics: Dict[str, Dict[Union[str, Tuple[int, int]], Surface]]
-    gifs: Dict[str, Dict[Union[str, Tuple[int, int]], List[Surface]]]
-    cropped_gifs: Dict[str, Dict[Tuple[int, int, int, int], List[Surface]]]
+    gifs: Dict[str, Dict[Union[str, Tuple[int, int]], Sequence[Surface]]]
+    rotated: LRUCache[Surface]
+    rendered: LRUCache[Surface]
+    explosions: LRUCache[Sequence[Surface]]
+    beams: LRUCache[Sequence[Surface]]
     default = "default"
 
     EXPLOSION_FRAMES_FILE = "explosion.gif"
@@ -47,7 +71,31 @@ class ImageManager:
     def __init__(self):
         self.pics = dict()
         self.gifs = dict()
-        self.cropped_gifs = dict()
+        self.rotated = LRUCache(ROTATION_CACHE_SIZE, get_surface_size)
+        self.rendered = LRUCache(RENDERED_CACHE_SIZE, get_surface_size)
+        self.explosions = LRUCache(EXPLOSION_SIZES_COUNT)
+        self.beams = LRUCache(BEAMS_COUNT)
+
+    def get_rendered(self, key: Hashable, render: Callable[[], Surface]) -> Surface:
+        # Surfaces drawn by views, which are the same while their key is
+        return self.rendered.get_or_create(key, render)
+
+    @staticmethod
+    def convert(image: Surface, alpha: bool = True) -> Surface:
+        # Surfaces of the display format are blitted without conversion
+        if pygame.display.get_surface() is None:
+            return image
+        return image.convert_alpha() if alpha else image.convert()
+
+    def get_rotated(self, image: Surface, angle: float) -> Surface:
+        # Images are shared, so rotated frames are shared between entities too
+        step = round(angle / ROTATION_STEP) % round(360 / ROTATION_STEP)
+        if step == 0:
+            return image
+        return self.rotated.get_or_create(
+            (image, step),
+            lambda: pygame.transform.rotate(image, step * ROTATION_STEP),
+        )
 
     def get_pic(
         self, name, w: Optional[int] = None, h: Optional[int] = None
@@ -57,7 +105,7 @@ class ImageManager:
         else:
             key = (w, h)
         if name not in self.pics:
-            img = load_image(name)
+            img = self.convert(load_image(name))
             width, height = img.get_size()
             self.pics[name] = dict()
             self.pics[name][self.default] = img
@@ -70,43 +118,59 @@ class ImageManager:
 
     def get_gif(
         self, name: str, w: Optional[int] = None, h: Optional[int] = None
-    ) -> List[Surface]:
+    ) -> Sequence[Surface]:
         if w is None or h is None:
             key = self.default
         else:
             key = (w, h)
         if name not in self.gifs:
-            gif = load_gif(name)
+            # Large GIFs are decoded frame by frame while they are played
+            if os.path.getsize(get_path_to_image(name)) >= LAZY_GIF_MIN_SIZE:
+                gif = open_gif(name, GIF_CACHE)
+            else:
+                gif = tuple(load_gif(name))
             width, height = gif[0].get_size()
             self.gifs[name] = dict()
             self.gifs[name][self.default] = gif
             self.gifs[name][(width, height)] = gif
         if key not in self.gifs[name]:
-            self.gifs[name][key] = [
-                pygame.transform.scale(img, (w, h))
-                for img in self.gifs[name][self.default]
-            ]
-        return self.gifs[name][key].copy()
-
-    def get_crop_gif(self, name: str, x: int, y: int, w: int, h: int) -> List[Surface]:
-        key = (x, y, w, h)
-        if name not in self.cropped_gifs:
-            self.cropped_gifs[name] = dict()
-        if key not in self.cropped_gifs[name]:
-            gif = self.get_gif(name)
-            gif_w, gif_h = gif[0].get_size()
-            x = (x + gif_w) % gif_w
-            y = (y + gif_h) % gif_h
-            if not w:
-                w = gif_w - x
-            if not h:
-                h = gif_h - y
-            self.cropped_gifs[name][key] = [
-                frame.subsurface((x, y, w, h)) for frame in gif
-            ]
-        return self.cropped_gifs[name][key]
+            self.gifs[name][key] = map_frames(
+                self.gifs[name][self.default],
+                lambda img: pygame.transform.scale(img, (w, h)),
+            )
+        # Frames are shared, so they are returned as a tuple instead of a copy
+        return self.gifs[name][key]
+
+    def get_beam(self, name: str, height: int, length: float) -> Sequence[Surface]:
+        # Beam is the end of frames scaled to its height. Lengths are rounded
+        # to a step, and frames are subsurfaces, so they are not copied
+        width = self.get_gif(name)[0].get_width()
+        gif = self.get_gif(name, width, height)
+        step = BEAM_LENGTH_STEP
+        length = min(width, max(1, round(length / step)) * step)
+        return self.beams.get_or_create(
+            (name, height, length),
+            lambda: map_frames(
+                gif,
+                lambda frame: frame.subsurface((width - length, 0, length, height)),
+                window=2,
+            ),
+        )
 
     def explosion_frames(
         self, w: Optional[int] = None, h: Optional[int] = None
-    ) -> List[Surface]:
+    ) -> Sequence[Surface]:
         return self.get_gif(self.EXPLOSION_FRAMES_FILE, w, h)
+
+    def get_explosion_frames(self, radius: float) -> Sequence[Surface]:
+        # Sizes are rounded up to a step, so explosions of close radii
+        # share frames, and only a few sizes are kept
+        step = EXPLOSION_SIZE_STEP
+        size = max(1, math.ceil(2 * radius / step)) * step
+        return self.explosions.get_or_create(
+            size,
+            lambda: tuple(
+                pygame.transform.scale(frame, (size, size))
+                for frame in self.explosion_frames()
+            ),
+        )
@@ -0,0 +1,87 @@
+import json
+from typing import Any, Callable, Iterator, TextIO, Tuple
+
+Path = Tuple[str, ...]
+
+WHITESPACE = " \t\n\r"
+READ_SIZE = 1 << 16
+
+
+class JsonStream:
+    """
+    Reads a JSON document from a file piece by piece. Objects whose paths
+    are split are walked key by key, other values are decoded whole,
+    so only one such value is kept in memory at a time
+    """
+
+    file: TextIO
+    buffer: str
+    pos: int
+    eof: bool
+
+    def __init__(self, file: TextIO):
+        self.file = file
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.file.read(READ_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise json.JSONDecodeError("Unexpected end", self.buffer, self.pos)
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buffer, self.pos)
+        self.pos += 1
+
+    def read_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # Number at the end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def items(
+        self, is_split: Callable[[Path], bool], path: Path = ()
+    ) -> Iterator[Tuple[Path, Any]]:
+        # Yields (path, value) for every value that is not split
+        if not is_split(path) or self.peek() != "{":
+            yield path, self.read_value()
+            return
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(":")
+            yield from self.items(is_split, (*path, key))
+            if self.peek() == "}":
+                self.pos += 1
+                return
+            self.expect(",")
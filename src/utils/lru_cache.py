@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LRUCache(Generic[T]):
+    """
+    Keeps values until their total weight exceeds max_weight,
+    then drops the least recently used ones
+    """
+
+    values: "OrderedDict[Hashable, T]"
+    weights: Dict[Hashable, int]
+    weight: int
+    max_weight: int
+
+    def __init__(self, max_weight: int, get_weight: Callable[[T], int] = lambda v: 1):
+        self.values = OrderedDict()
+        self.weights = dict()
+        self.weight = 0
+        self.max_weight = max_weight
+        self.get_weight = get_weight
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def get(self, key: Hashable) -> Optional[T]:
+        value = self.values.get(key)
+        if value is not None:
+            self.values.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: T) -> None:
+        self.pop(key)
+        self.values[key] = value
+        self.weights[key] = weight = self.get_weight(value)
+        self.weight += weight
+        # The newest value is kept even if it alone is heavier than the limit
+        while self.weight > self.max_weight and len(self.values) > 1:
+            self.pop(next(iter(self.values)))
+
+    def get_or_create(self, key: Hashable, create: Callable[[], T]) -> T:
+        value = self.get(key)
+        if value is None:
+            value = create()
+            self.put(key, value)
+        return value
+
+    def pop(self, key: Hashable) -> Optional[T]:
+        if key not in self.values:
+            return None
+        self.weight -= self.weights.pop(key)
+        return self.values.pop(key)
+
+    def clear(self) -> None:
+        self.values.clear()
+        self.weights.clear()
+        self.weight = 0
@@ -0,0 +1,71 @@
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+from src.utils.decorators import singleton
+
+
+class NullSection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+NULL_SECTION = NullSection()
+
+
+class ProfilerSection:
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+        self.children_time = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        self.children_time = 0.0
+        self.profiler.stack.append(self)
+        return self
+
+    def __exit__(self, *args):
+        elapsed = time.perf_counter() - self.start
+        stack = self.profiler.stack
+        stack.pop()
+        # Sections store exclusive time, so nested sections are not counted twice
+        self.profiler.current[self.name] += elapsed - self.children_time
+        if stack:
+            stack[-1].children_time += elapsed
+        return False
+
+
+@singleton
+class Profiler:
+
+    enabled: bool
+    stack: List[ProfilerSection]
+    current: Dict[str, float]
+    ticks: List[Dict[str, float]]
+
+    def __init__(self):
+        self.enabled = False
+        self.stack = []
+        self.current = defaultdict(float)
+        self.ticks = []
+
+    def section(self, name: str):
+        if not self.enabled:
+            return NULL_SECTION
+        return ProfilerSection(self, name)
+
+    def end_tick(self) -> Dict[str, float]:
+        tick = dict(self.current)
+        self.ticks.append(tick)
+        self.current.clear()
+        return tick
+
+    def reset(self):
+        self.stack.clear()
+        self.current.clear()
+        self.ticks.clear()
@@ -0,0 +1,96 @@
+import csv
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    name TEXT PRIMARY KEY,
+    score REAL NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    thumbnail BLOB
+)
+"""
+
+
+class SaveIndex:
+    """
+    Saves list in a SQLite database, so a save or deletion changes
+    only its own row. Saves of the old saves.csv are imported once
+    """
+
+    path: str
+    connection: sqlite3.Connection
+    lock: threading.Lock
+
+    def __init__(self, path: str, legacy_csv_path: Optional[str] = None):
+        self.path = path
+        # Saves are written by the saving thread, and listed by the main one
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.lock = threading.Lock()
+        with self.lock, self.connection:
+            migrated = self.connection.execute("PRAGMA user_version").fetchone()[0]
+            self.connection.execute(SCHEMA)
+            if not migrated:
+                if legacy_csv_path is not None and os.path.exists(legacy_csv_path):
+                    self.import_csv(legacy_csv_path)
+                self.connection.execute("PRAGMA user_version = 1")
+
+    def import_csv(self, csv_path: str) -> None:
+        directory = os.path.dirname(csv_path)
+        with open(csv_path, encoding="utf-8") as r:
+            for row in csv.DictReader(r, delimiter=";"):
+                size, timestamp = 0, time.time()
+                for ext in ("save", "json"):
+                    path = os.path.join(directory, f"{row['name']}.{ext}")
+                    if os.path.exists(path):
+                        size, timestamp = os.path.getsize(path), os.path.getmtime(path)
+                        break
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO saves VALUES (?, ?, ?, ?, ?, NULL)",
+                    (row["name"], float(row["score"]), timestamp, timestamp, size),
+                )
+
+    def upsert(
+        self, name: str, score: float, size: int, thumbnail: Optional[bytes] = None
+    ) -> None:
+        now = time.time()
+        with self.lock, self.connection:
+            self.connection.execute(
+                """
+                INSERT INTO saves VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET
+                    score = excluded.score,
+                    updated_at = excluded.updated_at,
+                    size = excluded.size,
+                    thumbnail = coalesce(excluded.thumbnail, thumbnail)
+                """,
+                (name, score, now, now, size, thumbnail),
+            )
+
+    def delete(self, name: str) -> None:
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM saves WHERE name = ?", (name,))
+
+    def list(self) -> List[Dict]:
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT name, score, created_at, updated_at, size FROM saves"
+                " ORDER BY created_at"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_thumbnail(self, name: str) -> Optional[bytes]:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT thumbnail FROM saves WHERE name = ?", (name,)
+            ).fetchone()
+        return None if row is None else row["thumbnail"]
+
+    def close(self) -> None:
+        self.connection.close()
@@ -0,0 +1,25 @@
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Optional
+
+from pygame import Surface
+
+from src.settings import save_game
+
+# Single worker writes saves one by one in order of requests
+executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="saving")
+
+
+def save_game_in_background(
+    name: str,
+    records: Dict[str, Dict],
+    score: float,
+    only_changes: bool = False,
+    screenshot: Optional[Surface] = None,
+) -> Future:
+    # Records and screenshot must not be changed after this call, they are
+    # encoded by the worker
+    return executor.submit(save_game, name, records, score, only_changes, screenshot)
+
+
+def wait_for_saves() -> None:
+    executor.submit(lambda: None).result()
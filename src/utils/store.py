@@ -23,6 +23,10 @@ class Store(Generic[T]):
         self.current_id += 1
         return self.current_id - 1
 
+    def reserve(self, obj_id: int) -> None:
+        # New objects get ids after the reserved one
+        self.current_id = max(self.current_id, obj_id + 1)
+
     def __getitem__(self, item: int):
         return self.objects.get(item, None)
 